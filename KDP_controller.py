@@ -14,6 +14,7 @@ import pyperclip  # Added for clipboard operations
 from utils.browser_utils import (
     quick_open_chrome,
     wait_for_page_load,
+    page_loaded_probe,
     close_browser_process,
     setup_pyautogui_safety,
     get_screen_center
@@ -460,7 +461,8 @@ class KDPController:
             
             # Step 3: Wait for page load
             print("⏳ Waiting for page load...")
-            wait_for_page_load(10, show_progress=True)
+            if not wait_for_page_load(10, show_progress=True, readiness_fn=page_loaded_probe()):
+                print("⚠️  Page readiness not confirmed, continuing after the full wait")
             
             # Step 4: Execute KDP sequence
             print(f"\n🎬 Step 4: Executing KDP publishing sequence")
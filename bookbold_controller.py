@@ -13,6 +13,7 @@ import pyautogui
 from utils.browser_utils import (
     quick_open_chrome,
     wait_for_page_load,
+    page_loaded_probe,
     close_browser_process,
     setup_pyautogui_safety,
     get_screen_center
@@ -753,7 +754,8 @@ class BookBoltController:
             
             # Step 4: Wait for page load
             print("⏳ Waiting for page load...")
-            wait_for_page_load(10, show_progress=True)
+            if not wait_for_page_load(10, show_progress=True, readiness_fn=page_loaded_probe()):
+                print("⚠️  Page readiness not confirmed, continuing after the full wait")
             
             # Step 5: Execute all notebooks
             print(f"\n🎬 Step 5: Executing batch sequences for all notebooks")
@@ -11,6 +11,7 @@ from typing import Dict, Any
 from utils.browser_utils import (
     quick_open_chrome,
     wait_for_page_load,
+    page_loaded_probe,
     close_browser_process,
     setup_pyautogui_safety
 )
@@ -205,7 +206,8 @@ class BookBoltController:
             
             # Step 4: Page load wait
             print("Waiting for page load...")
-            wait_for_page_load(10, show_progress=True)
+            if not wait_for_page_load(10, show_progress=True, readiness_fn=page_loaded_probe()):
+                print("Page readiness not confirmed, continuing after the full wait")
             
             # Step 5: Execute based on configuration
             if (with_user_input and self.user_config.total_notebooks and 
@@ -4,6 +4,7 @@ Handles loading settings from JSON files, environment variables, and provides de
 """
 
 import os
+import sys
 import json
 from pathlib import Path
 from dataclasses import dataclass, asdict
@@ -116,6 +117,34 @@ class Settings:
     Loads settings from JSON files, environment variables, and provides validation.
     """
     
+    # Cached existence of local_settings.json (None = not checked yet)
+    _local_status: Optional[bool] = None
+    
+    # Section layout for the generated summary printer (mirrors get_config_summary)
+    _SUMMARY_LAYOUT = (
+        ('browser', (
+            ('type', '{self.browser.driver_type}'),
+            ('headless', '{self.browser.headless}'),
+            ('window_size', '{self.browser.window_width}x{self.browser.window_height}'),
+        )),
+        ('automation', (
+            ('anti_detection', '{self.automation.anti_detection}'),
+            ('human_behavior', '{self.automation.human_behavior}'),
+            ('timeout', '{self.automation.default_timeout}'),
+            ('retries', '{self.automation.retry_attempts}'),
+        )),
+        ('mouse', (
+            ('randomization', '{self.mouse.randomize_position}'),
+            ('natural_movement', '{self.mouse.natural_movement}'),
+            ('click_delay', '{self.mouse.click_delay_min}-{self.mouse.click_delay_max}s'),
+        )),
+        ('logging', (
+            ('level', '{self.logging.log_level}'),
+            ('to_file', '{self.logging.log_to_file}'),
+            ('debug_mode', '{self.logging.debug_mode}'),
+        )),
+    )
+    
     def __init__(self, config_file: str = "config/settings.json"):
         self.config_file = config_file
         self.project_root = Path(__file__).parent.parent
@@ -257,9 +286,14 @@ class Settings:
     
     def _load_local_overrides(self):
         """Load local configuration overrides"""
+        # Skip the stat call once we know there are no local overrides
+        if Settings._local_status is False:
+            return
+        
         local_config_path = self.project_root / "config" / "local_settings.json"
+        Settings._local_status = local_config_path.exists()
         
-        if local_config_path.exists():
+        if Settings._local_status:
             try:
                 with open(local_config_path, 'r', encoding='utf-8') as f:
                     local_config = json.load(f)
@@ -380,6 +414,7 @@ class Settings:
     def reload_config(self):
         """Reload configuration from files"""
         print("🔄 Reloading configuration...")
+        Settings._local_status = None
         self._load_configuration()
         self._validate_configuration()
         print("✅ Configuration reloaded")
@@ -412,18 +447,37 @@ class Settings:
     
     def print_config_summary(self):
         """Print a formatted configuration summary"""
-        summary = self.get_config_summary()
-        
-        print("\n" + "="*50)
-        print("📋 CONFIGURATION SUMMARY")
-        print("="*50)
-        
-        for section, config in summary.items():
-            print(f"\n🔧 {section.upper()}:")
-            for key, value in config.items():
-                print(f"   • {key}: {value}")
+        self._print_config_summary_fast()
+    
+    @classmethod
+    def _build_printer(cls):
+        """
+        Generate the summary printer once from _SUMMARY_LAYOUT.
         
-        print("\n" + "="*50 + "\n")
+        The generated function writes every line with direct attribute
+        access, so printing does not build the nested summary dict.
+        """
+        banner = "=" * 50
+        header = "\n" + banner + "\n📋 CONFIGURATION SUMMARY\n" + banner + "\n"
+        lines = [
+            "def _print(self):",
+            "    w = sys.stdout.write",
+            f"    w({header!r})",
+        ]
+        for section, fields in cls._SUMMARY_LAYOUT:
+            title = "\n🔧 " + section.upper() + ":\n"
+            lines.append(f"    w({title!r})")
+            for key, fragment in fields:
+                line = "   • " + key + ": " + fragment + "\n"
+                lines.append(f"    w(f{line!r})")
+        footer = "\n" + banner + "\n\n"
+        lines.append(f"    w({footer!r})")
+        
+        namespace: Dict[str, Any] = {}
+        exec(compile("\n".join(lines), "<settings-summary>", "exec"), {'sys': sys}, namespace)
+        cls._print_config_summary_fast = namespace['_print']
+
+Settings._build_printer()
 
 # Global settings instance
 _settings_instance = None
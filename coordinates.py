@@ -1,8 +1,13 @@
+import sys
+
 from pynput import mouse, keyboard
 
 # Lista per memorizzare le coordinate dei click
 clicks = []
 
+# Coppie di click catturate alla pressione di Invio
+pairs = []
+
 def on_click(x, y, button, pressed):
     if pressed and button == mouse.Button.right:  # Solo tasto destro
         clicks.append((int(x), int(y)))  # Salva come interi
@@ -10,12 +15,8 @@ def on_click(x, y, button, pressed):
 def on_press(key):
     try:
         if key == keyboard.Key.enter:
-            # Stampa le coordinate a coppie
-            for i in range(0, len(clicks), 2):
-                if i + 1 < len(clicks):
-                    x1, y1 = clicks[i]
-                    x2, y2 = clicks[i+1]
-                    print(f"({x1}, {y1}, {x2}, {y2})")
+            # Salva le coppie e rimanda la stampa al thread principale
+            pairs.extend(zip(clicks[0::2], clicks[1::2]))
             return False  # Ferma l’ascolto della tastiera dopo Invio
     except Exception as e:
         print("Errore:", e)
@@ -27,3 +28,7 @@ mouse_listener.start()
 # Listener della tastiera
 with keyboard.Listener(on_press=on_press) as listener:
     listener.join()
+
+# Stampa le coordinate a coppie in un'unica scrittura
+if pairs:
+    sys.stdout.write("\n".join(f"({x1}, {y1}, {x2}, {y2})" for (x1, y1), (x2, y2) in pairs) + "\n")
@@ -0,0 +1,96 @@
+"""
+Native mouse backend bound directly to the Windows user32 API via ctypes.
+Used by MouseController in place of pyautogui for the hot mouse operations.
+"""
+
+import ctypes
+from typing import List, Optional, Tuple
+
+try:
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+    AVAILABLE = True
+except (ImportError, AttributeError, ValueError):
+    AVAILABLE = False
+
+# Windows input constants
+_INPUT_MOUSE = 0
+_MOUSEEVENTF_MOVE = 0x0001
+_MOUSEEVENTF_WHEEL = 0x0800
+_MOUSEEVENTF_HWHEEL = 0x1000
+_MOUSEEVENTF_ABSOLUTE = 0x8000
+
+# (down, up) flags per button
+_BUTTON_FLAGS = {
+    'left': (0x0002, 0x0004),
+    'right': (0x0008, 0x0010),
+    'middle': (0x0020, 0x0040),
+}
+
+if AVAILABLE:
+    class _LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [("cbSize", wintypes.UINT), ("dwTime", wintypes.DWORD)]
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG),
+                    ("mouseData", wintypes.DWORD), ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _INPUT(ctypes.Structure):
+        # MOUSEINPUT is the largest member of the INPUT union
+        _fields_ = [("type", wintypes.DWORD), ("mi", _MOUSEINPUT)]
+
+def get_pos() -> Tuple[int, int]:
+    """Get current cursor position"""
+    point = wintypes.POINT()
+    _user32.GetCursorPos(ctypes.byref(point))
+    return point.x, point.y
+
+def move_to(x: int, y: int):
+    """Move cursor to absolute screen coordinates"""
+    _user32.SetCursorPos(int(x), int(y))
+
+def _send_buttons(flags: Tuple[int, ...]) -> bool:
+    """Post button events at the current cursor position with a single SendInput call"""
+    inputs = (_INPUT * len(flags))()
+    for item, flag in zip(inputs, flags):
+        item.type = _INPUT_MOUSE
+        item.mi.dwFlags = flag
+    return _user32.SendInput(len(flags), inputs, ctypes.sizeof(_INPUT)) == len(flags)
+
+def click(button: str = 'left') -> bool:
+    """Press and release a mouse button at the current cursor position (False if input was blocked)"""
+    down, up = _BUTTON_FLAGS[button]
+    return _send_buttons((down, up))
+
+def double_click(button: str = 'left') -> bool:
+    """Two back-to-back clicks, recognised by the OS as a double-click (False if input was blocked)"""
+    down, up = _BUTTON_FLAGS[button]
+    return _send_buttons((down, up, down, up))
+
+def scroll(dx: int = 0, dy: int = 0):
+    """Scroll wheel by clicks (dy vertical, dx horizontal), same units as pyautogui"""
+    if dy:
+        _user32.mouse_event(_MOUSEEVENTF_WHEEL, 0, 0, ctypes.c_uint32(dy).value, 0)
+    if dx:
+        _user32.mouse_event(_MOUSEEVENTF_HWHEEL, 0, 0, ctypes.c_uint32(dx).value, 0)
+
+def send_moves(points: List[Tuple[int, int]], screen_width: int, screen_height: int) -> bool:
+    """Post absolute mouse moves for all points with a single SendInput call"""
+    inputs = (_INPUT * len(points))()
+    for item, (x, y) in zip(inputs, points):
+        item.type = _INPUT_MOUSE
+        item.mi.dx = x * 65535 // max(1, screen_width - 1)
+        item.mi.dy = y * 65535 // max(1, screen_height - 1)
+        item.mi.dwFlags = _MOUSEEVENTF_MOVE | _MOUSEEVENTF_ABSOLUTE
+    return _user32.SendInput(len(points), inputs, ctypes.sizeof(_INPUT)) == len(points)
+
+def idle_ms() -> Optional[int]:
+    """Milliseconds since the last system-wide user input"""
+    info = _LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(_LASTINPUTINFO)
+    if not _user32.GetLastInputInfo(ctypes.byref(info)):
+        return None
+    return (_kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF
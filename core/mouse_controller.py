@@ -6,9 +6,14 @@ Provides natural mouse movements, area-based clicking, and human-like behavior p
 import time
 import random
 import math
+import atexit
+import threading
+from collections import deque
 from typing import Tuple, List, Optional, Dict, Any
 from dataclasses import dataclass
 
+import numpy as np
+
 try:
     import pyautogui
     PYAUTOGUI_AVAILABLE = True
@@ -16,13 +21,86 @@ except ImportError:
     PYAUTOGUI_AVAILABLE = False
     print("⚠️  pyautogui not available. Mouse operations will be simulated.")
 
-from utils.coordinate_helper import CoordinateHelper, Point, Rectangle
+from core import _mouse_backend as native_mouse
+from utils.coordinate_helper import CoordinateHelper, Point
 from utils.random_helper import RandomHelper, BehaviorProfile
 from utils.logger import get_logger, log_mouse, log_action, log_detection
 
-@dataclass
+def _natural_tween(n: float) -> float:
+    """
+    Tween for pyautogui.moveTo matching the natural speed curve.
+    
+    The cursor spends time proportional to (2 - |0.5 - p|) at each progress
+    point p, i.e. it eases through the middle of the movement. This inverts
+    the cumulative time of that curve so that n (elapsed time fraction)
+    maps to the progress along the line.
+    """
+    elapsed = n * 1.75  # Total area under the speed curve on [0, 1]
+    if elapsed <= 0.875:
+        return -1.5 + math.sqrt(2.25 + 2 * elapsed)
+    return 1 - (-1.5 + math.sqrt(2.25 + 2 * (1.75 - elapsed)))
+
+# Hot-path log records from every controller are queued raw, stamped with
+# time.time() when queued, and formatted by one shared background flusher
+_LOG_RING_SIZE = 4096
+_log_ring = deque(maxlen=_LOG_RING_SIZE)
+_log_lock = threading.Lock()
+_log_flush_lock = threading.Lock()
+_log_dropped = 0
+_log_flusher = None
+
+def _queue_log_record(record: tuple):
+    """Append a record to the shared ring, counting the oldest one if it gets evicted"""
+    global _log_dropped
+    with _log_lock:
+        if len(_log_ring) == _LOG_RING_SIZE:
+            _log_dropped += 1
+        _log_ring.append(record)
+
+def flush_mouse_logs():
+    """Format and emit all queued mouse controller log records"""
+    global _log_dropped
+    with _log_flush_lock:
+        while True:
+            with _log_lock:
+                if not _log_ring:
+                    dropped, _log_dropped = _log_dropped, 0
+                    break
+                created, kind, event, extra, template, args = _log_ring.popleft()
+            
+            details = template.format(*args) if args else template
+            if kind == "mouse":
+                log_mouse(event, extra, details, created)
+            elif kind == "action":
+                log_action(event, details, extra, created)
+            else:
+                log_detection(event, details, extra, created)
+        
+        if dropped:
+            log_detection("log_records_dropped", f"{dropped} queued log records were discarded (ring full)", "WARNING")
+
+def _flush_logs_loop():
+    """Background loop draining the shared log ring every 200ms"""
+    while True:
+        time.sleep(0.2)
+        try:
+            flush_mouse_logs()
+        except Exception as e:
+            get_logger("mouse").error(f"❌ Log flush failed: {e}")
+
+def _ensure_log_flusher():
+    """Start the shared flusher thread on first use"""
+    global _log_flusher
+    with _log_lock:
+        if _log_flusher is None:
+            _log_flusher = threading.Thread(target=_flush_logs_loop, name="mouse-log-flusher", daemon=True)
+            _log_flusher.start()
+
+atexit.register(flush_mouse_logs)
+
+@dataclass(slots=True)
 class MouseState:
-    """Tracks current mouse state and statistics"""
+    """Tracks current mouse state and statistics (all times are on the monotonic clock)"""
     current_position: Point = None
     last_click_time: float = 0.0
     last_move_time: float = 0.0
@@ -38,25 +116,42 @@ class MouseController:
     Simulates human-like mouse behavior with randomization and natural patterns.
     """
     
+    # Re-read the real cursor position after this long without our own movement
+    POSITION_RESYNC_IDLE = 5.0
+    
+    # Number of per-click random decisions drawn in one batch
+    DECISION_TAPE_SIZE = 4096
+    
     def __init__(self, settings, behavior_profile: Optional[BehaviorProfile] = None):
         self.settings = settings
         self.coordinate_helper = CoordinateHelper()
         self.random_helper = RandomHelper(behavior_profile)
         self.logger = get_logger("mouse")
+        self.refresh_settings()
         
         # Initialize mouse state
         self.state = MouseState()
-        self.state.session_start = time.time()
+        self.state.session_start = time.monotonic_ns() * 1e-9
+        
+        # Cached cursor position is authoritative unless marked dirty
+        self._pos_dirty = True
+        self._pos_synced_at = 0.0
+        
+        # Prefer the native input backend, fall back to pyautogui
+        self._native = native_mouse.AVAILABLE
+        self._input_available = self._native or PYAUTOGUI_AVAILABLE
         
         # Configure pyautogui if available
         if PYAUTOGUI_AVAILABLE:
             pyautogui.FAILSAFE = True
             pyautogui.PAUSE = 0.0  # We handle our own delays
-            
+        
+        if self._input_available:
             # Get current mouse position
             try:
-                current_pos = pyautogui.position()
-                self.state.current_position = Point(current_pos.x, current_pos.y)
+                self.state.current_position = Point(*self._os_position())
+                self._pos_dirty = False
+                self._pos_synced_at = time.monotonic()
             except Exception:
                 self.state.current_position = self.coordinate_helper.get_screen_center()
         else:
@@ -64,10 +159,48 @@ class MouseController:
         
         # Screen dimensions
         self.screen_width, self.screen_height = self.coordinate_helper.get_screen_size()
+        self._safe_bounds = {}  # margin -> (min_x, max_x, min_y, max_y)
+        self._cpm_ema = 0.0  # Clicks per minute, updated on each click
+        self._bezier_basis = {}  # steps -> (B0, B1, B2, B3) weight vectors
+        
+        # Hot-path log records go to the shared module-level flusher
+        _ensure_log_flusher()
         
         log_detection("mouse_controller_init", f"Screen: {self.screen_width}x{self.screen_height}", "INFO")
         self.logger.info(f"🖱️  Mouse controller initialized - Screen: {self.screen_width}x{self.screen_height}")
     
+    def refresh_settings(self):
+        """Cache hot settings values (call again after settings are reloaded)"""
+        self._anti_detect = self.settings.automation.anti_detection
+        self._click_delay_min = self.settings.mouse.click_delay_min
+        self._click_delay_max = self.settings.mouse.click_delay_max
+        self._move_speed = self.settings.mouse.movement_speed
+        self._refill_tape()
+    
+    def _refill_tape(self):
+        """Pre-draw per-click random decisions (hesitation, micro-adjust, delays, double-check)"""
+        size = self.DECISION_TAPE_SIZE
+        rh = self.random_helper
+        
+        # Decision probabilities are read once per batch
+        self._p_hes = rh.hesitation_prob("normal")
+        self._p_dbl = rh.double_check_prob()
+        
+        self._tape_hesitate = (np.random.random(size) < self._p_hes).tolist()
+        self._tape_micro_adjust = (np.random.random(size) < 0.3).tolist()
+        self._tape_pre_delay = rh.get_click_delays(self._click_delay_min, self._click_delay_max, size).tolist()
+        self._tape_post_delay = rh.get_click_delays(0.05, 0.2, size).tolist()
+        self._tape_double_check = (np.random.random(size) < self._p_dbl).tolist()
+        self._tape_idx = 0
+    
+    def _advance_tape(self) -> int:
+        """Return the tape slot for the next click, refilling when exhausted"""
+        if self._tape_idx >= self.DECISION_TAPE_SIZE:
+            self._refill_tape()
+        i = self._tape_idx
+        self._tape_idx = i + 1
+        return i
+    
     # Core clicking methods
     
     def click_at_coordinates(self, x: int, y: int, button: str = 'left', 
@@ -88,7 +221,7 @@ class MouseController:
             target_point = Point(x, y)
             
             # Validate coordinates
-            if not self.coordinate_helper.validate_point(target_point, margin=5):
+            if not self._is_safe(x, y, 5):
                 self.logger.error(f"❌ Invalid coordinates: {target_point}")
                 return False
             
@@ -101,22 +234,13 @@ class MouseController:
             else:
                 self._move_directly_to_target(target_point)
             
-            # Pre-click pause and micro-adjustments
-            self._pre_click_behavior(target_point)
-            
-            # Perform the actual click
-            click_success = self._execute_click(target_point, button)
-            
-            # Post-click behavior
-            self._post_click_behavior(click_success)
-            
-            # Update statistics
-            self.state.total_clicks += 1
-            self.state.last_click_time = time.time()
+            # Pre-click behavior, click, post-click behavior and statistics
+            click_success = self._do_click(target_point, button)
             
             # Log the action
-            log_mouse("click", target_point.to_tuple(), f"{button} button")
-            log_action("click", f"Clicked at {target_point} with {button} button", click_success)
+            self._defer_log("mouse", "click", target_point.to_tuple(), "{} button", button)
+            self._defer_log("action", "click", click_success,
+                            "Clicked at {} with {} button", target_point, button)
             
             return click_success
             
@@ -140,13 +264,21 @@ class MouseController:
             bool: True if click was successful
         """
         try:
-            # Apply safety margin if requested
-            if safe_margin > 0:
-                adjusted_x_range, adjusted_y_range = self.coordinate_helper.apply_margin_to_area(
-                    x_range, y_range, safe_margin
-                )
-            else:
-                adjusted_x_range, adjusted_y_range = x_range, y_range
+            # Fast path: no margin, sample the area directly (click_at_coordinates logs the click)
+            if safe_margin <= 0:
+                x_min, x_max = x_range
+                y_min, y_max = y_range
+                if x_min > x_max:
+                    x_min, x_max = x_max, x_min
+                if y_min > y_max:
+                    y_min, y_max = y_max, y_min
+                return self.click_at_coordinates(random.randint(x_min, x_max),
+                                                 random.randint(y_min, y_max), button)
+            
+            # Apply safety margin
+            adjusted_x_range, adjusted_y_range = self.coordinate_helper.apply_margin_to_area(
+                x_range, y_range, safe_margin
+            )
             
             # Get random point in area
             target_point = self.coordinate_helper.get_random_point_in_area(
@@ -154,7 +286,8 @@ class MouseController:
             )
             
             self.logger.info(f"🎯 Area click: {x_range}x{y_range} → target: {target_point}")
-            log_detection("area_click", f"Area: {x_range}x{y_range}, Target: {target_point}", "INFO")
+            self._defer_log("detection", "area_click", "INFO",
+                            "Area: {}x{}, Target: {}", x_range, y_range, target_point)
             
             return self.click_at_coordinates(target_point.x, target_point.y, button)
             
@@ -164,20 +297,28 @@ class MouseController:
             return False
     
     def double_click_at_coordinates(self, x: int, y: int) -> bool:
-        """Perform double click with natural timing"""
+        """Perform double click with a natural approach and a single OS double-click"""
         try:
-            # First click
-            if not self.click_at_coordinates(x, y, natural_approach=True):
+            target_point = Point(x, y)
+            
+            if not self._is_safe(x, y, 5):
+                self.logger.error(f"❌ Invalid coordinates: {target_point}")
                 return False
             
-            # Natural interval between clicks
-            interval = self.random_helper.get_click_delay(0.05, 0.15)
-            time.sleep(interval)
+            # Natural approach only, then let the OS fire the double-click event
+            if not self._move_naturally_to_target(target_point):
+                self._move_directly_to_target(target_point)
+            
+            t_click = time.monotonic_ns() * 1e-9
+            if self._input_available:
+                click_success = self._os_double_click('left')
+            else:
+                self.logger.info(f"🖱️  [SIMULATED] Double-clicked at {target_point}")
+                click_success = True
             
-            # Second click (no movement, just click)
-            click_success = self._execute_click(Point(x, y), 'left')
+            self._record_click(t_click)
             
-            log_action("double_click", f"Double-clicked at ({x}, {y})", click_success)
+            self._defer_log("action", "double_click", click_success, "Double-clicked at ({}, {})", x, y)
             return click_success
             
         except Exception as e:
@@ -219,16 +360,16 @@ class MouseController:
         try:
             target_point = Point(x, y)
             
-            if not self.coordinate_helper.validate_point(target_point):
+            if not self._is_safe(target_point.x, target_point.y, 0):
                 target_point = self.coordinate_helper.clamp_point(target_point)
                 self.logger.warning(f"⚠️  Clamped coordinates to {target_point}")
             
-            if natural and self.settings.automation.anti_detection:
+            if natural and self._anti_detect:
                 success = self._move_naturally_to_target(target_point)
             else:
                 success = self._move_directly_to_target(target_point)
             
-            log_mouse("move", target_point.to_tuple(), "Natural" if natural else "Direct")
+            self._defer_log("mouse", "move", target_point.to_tuple(), "Natural" if natural else "Direct")
             return success
             
         except Exception as e:
@@ -254,17 +395,25 @@ class MouseController:
             if not self.move_to_coordinates(target_point.x, target_point.y):
                 return False
             
+            # Pre-generate micro-movements for every 100ms hover frame
+            n_frames = int(duration / 0.1) + 1
+            jitter_frames = (np.random.random(n_frames) < 0.3).tolist()  # 30% chance of micro-movement
+            offsets = np.random.randint(-2, 3, size=(n_frames, 2)).tolist()
+            
             # Hover with small movements
-            hover_end_time = time.time() + duration
+            hover_end_time = time.monotonic() + duration
+            frame = 0
             
-            while time.time() < hover_end_time:
+            while time.monotonic() < hover_end_time:
                 # Small random movement while hovering
-                if random.random() < 0.3:  # 30% chance of micro-movement
-                    offset_point = self.coordinate_helper.offset_coordinates(
-                        target_point.x, target_point.y, max_offset=2
+                if jitter_frames[frame % n_frames]:
+                    offset_x, offset_y = offsets[frame % n_frames]
+                    offset_point = self.coordinate_helper.clamp_coordinates(
+                        target_point.x + offset_x, target_point.y + offset_y
                     )
                     self._move_directly_to_target(offset_point)
                 
+                frame += 1
                 time.sleep(0.1)
             
             log_action("hover", f"Hovered over area for {duration:.1f}s", True)
@@ -287,25 +436,29 @@ class MouseController:
             bool: True if successful
         """
         try:
-            avoid_rect = Rectangle(avoid_area[0][0], avoid_area[1][0], 
-                                 avoid_area[0][1], avoid_area[1][1])
-            
-            # Find safe position
-            max_attempts = 10
-            for _ in range(max_attempts):
-                # Generate random position on screen
-                target_x = random.randint(50, self.screen_width - 50)
-                target_y = random.randint(50, self.screen_height - 50)
-                target_point = Point(target_x, target_y)
-                
-                # Check if far enough from avoid area
-                distance = avoid_rect.center.distance_to(target_point)
-                if distance >= min_distance:
+            (x1, x2), (y1, y2) = avoid_area
+            center_x = (x1 + x2) // 2
+            center_y = (y1 + y2) // 2
+            
+            min_x, max_x = 50, self.screen_width - 50
+            min_y, max_y = 50, self.screen_height - 50
+            min_distance_sq = min_distance * min_distance
+            
+            # Sample a point at min_distance..2*min_distance from the area center,
+            # trying the opposite side if clamping to the screen pulls it too close
+            angle = random.uniform(0, 2 * math.pi)
+            radius = random.uniform(min_distance, min_distance * 2)
+            for theta in (angle, angle + math.pi):
+                target_x = max(min_x, min(max_x, int(center_x + radius * math.cos(theta))))
+                target_y = max(min_y, min(max_y, int(center_y + radius * math.sin(theta))))
+                dx = target_x - center_x
+                dy = target_y - center_y
+                if dx * dx + dy * dy >= min_distance_sq:
                     return self.move_to_coordinates(target_x, target_y)
             
-            # Fallback: move to screen corner
-            corner_x = self.screen_width - 100
-            corner_y = self.screen_height - 100
+            # Fallback: move to the screen corner farthest from the area
+            corner_x = min_x if center_x - min_x > max_x - center_x else max_x
+            corner_y = min_y if center_y - min_y > max_y - center_y else max_y
             return self.move_to_coordinates(corner_x, corner_y)
             
         except Exception as e:
@@ -344,7 +497,7 @@ class MouseController:
             self.state.is_dragging = True
             drag_success = self._execute_drag(start_point, end_point, duration)
             self.state.is_dragging = False
-            self.state.last_drag_end = time.time()
+            self.state.last_drag_end = time.monotonic()
             
             log_action("drag", f"Dragged from {start_point} to {end_point}", drag_success)
             return drag_success
@@ -411,7 +564,7 @@ class MouseController:
             
             scroll_success = self._execute_scroll(x, y, varied_amount, horizontal=False)
             
-            log_mouse("scroll", (x, y), f"Vertical: {varied_amount}")
+            self._defer_log("mouse", "scroll", (x, y), "Vertical: {}", varied_amount)
             return scroll_success
             
         except Exception as e:
@@ -432,7 +585,7 @@ class MouseController:
             
             scroll_success = self._execute_scroll(x, y, varied_amount, horizontal=True)
             
-            log_mouse("scroll", (x, y), f"Horizontal: {varied_amount}")
+            self._defer_log("mouse", "scroll", (x, y), "Horizontal: {}", varied_amount)
             return scroll_success
             
         except Exception as e:
@@ -471,24 +624,27 @@ class MouseController:
                 scroll_pos = self.get_current_position()
                 x, y = scroll_pos.x, scroll_pos.y
             
-            # Break total scroll into natural chunks
-            remaining = abs(total_amount)
+            # Break total scroll into natural chunks of 1-5 scroll units
+            total = abs(total_amount)
             scroll_direction = 1 if total_amount > 0 else -1
             
-            while remaining > 0:
-                # Random chunk size (1-5 scroll units)
-                chunk_size = min(remaining, random.randint(1, 5))
-                scroll_amount = chunk_size * scroll_direction
-                
+            chunks = np.random.randint(1, 6, size=total)
+            if total > 0:
+                # Keep chunks until the total is covered, trimming the last one
+                ends = np.cumsum(chunks)
+                n_chunks = int(np.searchsorted(ends, total)) + 1
+                chunks = chunks[:n_chunks]
+                chunks[-1] = total - (ends[n_chunks - 2] if n_chunks > 1 else 0)
+            
+            # Random pauses between scrolls
+            pauses = np.random.uniform(0.1, 0.3, size=max(0, len(chunks) - 1)).tolist()
+            
+            for i, chunk_size in enumerate(chunks.tolist()):
                 # Execute scroll
-                self._execute_scroll(x, y, scroll_amount, horizontal=False)
-                
-                remaining -= chunk_size
+                self._execute_scroll(x, y, chunk_size * scroll_direction, horizontal=False)
                 
-                # Random pause between scrolls
-                if remaining > 0:
-                    pause = self.random_helper.get_click_delay(0.1, 0.3)
-                    time.sleep(pause)
+                if i < len(pauses):
+                    time.sleep(pauses[i])
             
             log_action("natural_scroll", f"Scrolled {total_amount} units naturally", True)
             return True
@@ -500,12 +656,28 @@ class MouseController:
     # Utility and state methods
     
     def get_current_position(self) -> Point:
-        """Get current mouse position"""
-        if PYAUTOGUI_AVAILABLE:
+        """
+        Get current mouse position.
+        
+        This controller is the only writer of the cursor, so the tracked
+        position is returned without querying the OS unless it was marked
+        dirty (emergency stop) or the mouse has been left idle long enough
+        for the user to have moved it.
+        """
+        last_sync = max(self.state.last_move_time, self._pos_synced_at)
+        if not self._pos_dirty and time.monotonic() - last_sync < self.POSITION_RESYNC_IDLE:
+            return self.state.current_position
+        
+        return self._read_position()
+    
+    def _read_position(self) -> Point:
+        """Query the real cursor position and refresh the cached state"""
+        if self._input_available:
             try:
-                pos = pyautogui.position()
-                current_pos = Point(pos.x, pos.y)
+                current_pos = Point(*self._os_position())
                 self.state.current_position = current_pos
+                self._pos_dirty = False
+                self._pos_synced_at = time.monotonic()
                 return current_pos
             except Exception:
                 pass
@@ -514,22 +686,47 @@ class MouseController:
     
     def is_position_safe(self, x: int, y: int, margin: int = 10) -> bool:
         """Check if position is safe for clicking"""
-        return self.coordinate_helper.validate_coordinates(x, y, margin)
+        return self._is_safe(x, y, margin)
+    
+    def _is_safe(self, x: int, y: int, margin: int = 5) -> bool:
+        """Check coordinates against cached screen bounds for the given margin"""
+        bounds = self._safe_bounds.get(margin)
+        if bounds is None:
+            bounds = self._safe_bounds[margin] = (
+                margin, self.screen_width - margin, margin, self.screen_height - margin
+            )
+        return bounds[0] <= x <= bounds[1] and bounds[2] <= y <= bounds[3]
     
     def wait_for_mouse_idle(self, timeout: float = 5.0) -> bool:
         """Wait for mouse to become idle (stop moving)"""
         try:
-            start_time = time.time()
-            last_pos = self.get_current_position()
+            start_time = time.monotonic()
+            delay = 0.02  # Exponential backoff between checks, capped at 200ms
+            
+            # Windows reports system-wide idle time directly
+            if self._native and native_mouse.idle_ms() is not None:
+                while time.monotonic() - start_time < timeout:
+                    if native_mouse.idle_ms() >= 300:  # No input for 300ms
+                        return True
+                    
+                    time.sleep(delay)
+                    delay = min(0.2, delay * 1.5)
+                
+                return False  # Timeout
+            
+            last_pos = self._read_position()
             
-            while time.time() - start_time < timeout:
-                current_pos = self.get_current_position()
+            while time.monotonic() - start_time < timeout:
+                current_pos = self._read_position()
                 
-                if last_pos.distance_to(current_pos) < 2:  # Mouse is idle
+                dx = last_pos.x - current_pos.x
+                dy = last_pos.y - current_pos.y
+                if dx * dx + dy * dy < 4:  # Moved less than 2px, mouse is idle
                     return True
                 
                 last_pos = current_pos
-                time.sleep(0.1)
+                time.sleep(delay)
+                delay = min(0.2, delay * 1.5)
             
             return False  # Timeout
             
@@ -571,51 +768,49 @@ class MouseController:
     
     def get_mouse_statistics(self) -> Dict[str, Any]:
         """Get mouse usage statistics"""
-        session_duration = time.time() - self.state.session_start
+        now = time.monotonic_ns() * 1e-9
         
         return {
-            "session_duration": session_duration,
+            "session_duration": now - self.state.session_start,
             "total_clicks": self.state.total_clicks,
             "total_moves": self.state.total_moves,
-            "clicks_per_minute": (self.state.total_clicks / (session_duration / 60)) if session_duration > 0 else 0,
+            "clicks_per_minute": self._cpm_ema,
             "current_position": self.state.current_position.to_tuple(),
-            "last_click_ago": time.time() - self.state.last_click_time,
+            "last_click_ago": now - self.state.last_click_time,
             "is_dragging": self.state.is_dragging
         }
     
     # Private implementation methods
     
     def _move_naturally_to_target(self, target: Point) -> bool:
-        """Move mouse naturally to target with curves and variation"""
+        """Move mouse naturally to target with an eased, batched movement"""
         try:
             start_point = self.get_current_position()
             
-            # Generate natural path
-            path = self.coordinate_helper.generate_natural_path(
-                start_point, target, human_like=True
-            )
-            
-            # Execute movement along path
-            total_distance = start_point.distance_to(target)
-            base_speed = self.settings.mouse.movement_speed
-            
-            for i, point in enumerate(path):
-                if PYAUTOGUI_AVAILABLE:
-                    pyautogui.moveTo(point.x, point.y)
-                
-                self.state.current_position = point
-                
-                # Variable speed - slower at start/end, faster in middle
-                progress = i / (len(path) - 1) if len(path) > 1 else 1
-                speed_multiplier = 1 - abs(0.5 - progress)  # Parabolic speed curve
-                
-                move_delay = (0.01 / base_speed) * (1 + speed_multiplier)
-                move_delay = max(0.005, min(0.05, move_delay))  # Clamp delays
-                
-                time.sleep(move_delay)
+            # The native backend streams the curved path itself; pyautogui
+            # eases along a straight line
+            if self._native:
+                path = self._bezier_path(start_point, target)
+                steps = len(path)
+            else:
+                steps = max(5, int(start_point.distance_to(target) / 15))  # ~15 pixels per step
+            
+            # Per-waypoint delay schedule (slower in the middle)
+            base_speed = self._move_speed
+            progress = np.linspace(0.0, 1.0, steps)
+            delays = np.clip((0.01 / base_speed) * (2 - np.abs(0.5 - progress)), 0.005, 0.05)
+            total_duration = float(delays.sum())
+            
+            if self._native:
+                self._stream_path(path, delays.tolist())
+            elif PYAUTOGUI_AVAILABLE:
+                pyautogui.moveTo(target.x, target.y, duration=total_duration, tween=_natural_tween)
+            else:
+                time.sleep(total_duration)
             
+            self.state.current_position = target
             self.state.total_moves += 1
-            self.state.last_move_time = time.time()
+            self.state.last_move_time = time.monotonic()
             
             return True
             
@@ -623,15 +818,75 @@ class MouseController:
             self.logger.error(f"❌ Natural movement failed: {e}")
             return False
     
+    def _bezier_path(self, start: Point, end: Point) -> List[Tuple[int, int]]:
+        """
+        Generate a curved cubic Bezier path with human-like jitter.
+        
+        The basis weights only depend on the number of points, so they are
+        cached per step count (bucketed to multiples of 10) and each path is
+        four weighted sums plus noise.
+        """
+        distance = start.distance_to(end)
+        steps = min(120, max(20, int(distance / 10)))
+        steps = int(round(steps / 10.0)) * 10
+        
+        basis = self._bezier_basis.get(steps)
+        if basis is None:
+            t = np.linspace(0.0, 1.0, steps, dtype=np.float32)
+            omt = 1.0 - t
+            basis = self._bezier_basis[steps] = (omt ** 3, 3 * omt ** 2 * t, 3 * omt * t ** 2, t ** 3)
+        b0, b1, b2, b3 = basis
+        
+        # Random control points (longer moves = more curved)
+        if distance < 50:
+            curve_intensity = 0.1
+        elif distance < 200:
+            curve_intensity = 0.2
+        else:
+            curve_intensity = 0.3
+        spread = distance * curve_intensity * 0.5
+        dx, dy = end.x - start.x, end.y - start.y
+        c1x, c1y, c2x, c2y = np.random.uniform(-spread, spread, 4) + (
+            start.x + dx / 3, start.y + dy / 3, start.x + 2 * dx / 3, start.y + 2 * dy / 3
+        )
+        
+        # Small Gaussian imperfections clamped to 2 pixels
+        noise = np.clip(np.random.normal(0, 2 / 3, (2, steps)), -2, 2)
+        xs = b0 * start.x + b1 * c1x + b2 * c2x + b3 * end.x + noise[0]
+        ys = b0 * start.y + b1 * c1y + b2 * c2y + b3 * end.y + noise[1]
+        xs = np.clip(np.rint(xs), 0, self.screen_width).astype(int)
+        ys = np.clip(np.rint(ys), 0, self.screen_height).astype(int)
+        
+        path = list(zip(xs.tolist(), ys.tolist()))
+        path[-1] = end.to_tuple()
+        return path
+    
+    def _stream_path(self, path: List[Tuple[int, int]], delays: List[float]):
+        """Send path waypoints in batches, one SendInput call per ~15ms slice"""
+        batch = []
+        batch_delay = 0.0
+        last_index = len(path) - 1
+        
+        for i, (point, delay) in enumerate(zip(path, delays)):
+            batch.append(point)
+            batch_delay += delay
+            
+            # Sleeps shorter than the Windows timer tick are not honoured anyway
+            if batch_delay >= 0.015 or i == last_index:
+                native_mouse.send_moves(batch, self.screen_width, self.screen_height)
+                time.sleep(batch_delay)
+                batch = []
+                batch_delay = 0.0
+    
     def _move_directly_to_target(self, target: Point) -> bool:
         """Move mouse directly to target"""
         try:
-            if PYAUTOGUI_AVAILABLE:
-                pyautogui.moveTo(target.x, target.y)
+            if self._input_available:
+                self._os_move_to(target.x, target.y)
             
             self.state.current_position = target
             self.state.total_moves += 1
-            self.state.last_move_time = time.time()
+            self.state.last_move_time = time.monotonic()
             
             return True
             
@@ -639,68 +894,80 @@ class MouseController:
             self.logger.error(f"❌ Direct movement failed: {e}")
             return False
     
-    def _pre_click_behavior(self, target: Point):
-        """Execute pre-click behavior (hesitation, micro-adjustments)"""
+    def _do_click(self, target: Point, button: str) -> bool:
+        """
+        Click kernel: hesitation, micro-adjustment, pre-click delay, click,
+        post-click delay and optional double-check, driven by one decision tape slot.
+        """
+        t_start = time.monotonic_ns() * 1e-9  # Single timestamp for this click
+        i = self._advance_tape()
+        st = self.state
+        sleep = time.sleep
+        defer_log = self._defer_log
+        anti_detect = self._anti_detect
+        input_available = self._input_available
+        
         # Hesitation check
-        if self.random_helper.should_hesitate("normal"):
+        if self._tape_hesitate[i]:
             hesitation_pause = self.random_helper.get_natural_pause("hesitation")
-            time.sleep(hesitation_pause)
-            log_detection("pre_click_hesitation", f"Hesitated {hesitation_pause:.2f}s", "INFO")
+            sleep(hesitation_pause)
+            defer_log("detection", "pre_click_hesitation", "INFO", "Hesitated {:.2f}s", hesitation_pause)
         
         # Micro-adjustment (small final movement)
-        if random.random() < 0.3 and self.settings.automation.anti_detection:
+        if anti_detect and self._tape_micro_adjust[i]:
             micro_offset = self.coordinate_helper.offset_coordinates(
                 target.x, target.y, max_offset=2, distribution="gaussian"
             )
-            if PYAUTOGUI_AVAILABLE:
-                pyautogui.moveTo(micro_offset.x, micro_offset.y)
-            self.state.current_position = micro_offset
-            
-            log_detection("micro_adjustment", f"Micro-adjusted to {micro_offset}", "INFO")
+            if input_available:
+                self._os_move_to(micro_offset.x, micro_offset.y)
+            st.current_position = micro_offset
+            defer_log("detection", "micro_adjustment", "INFO", "Micro-adjusted to {}", micro_offset)
         
         # Pre-click delay
-        pre_click_delay = self.random_helper.get_click_delay(
-            self.settings.mouse.click_delay_min,
-            self.settings.mouse.click_delay_max
-        )
-        time.sleep(pre_click_delay)
-    
-    def _execute_click(self, point: Point, button: str) -> bool:
-        """Execute the actual mouse click"""
+        sleep(self._tape_pre_delay[i])
+        
+        # Perform the actual click (cursor is already positioned)
         try:
-            if PYAUTOGUI_AVAILABLE:
-                pyautogui.click(point.x, point.y, button=button)
+            if input_available:
+                click_success = self._os_click(button)
+                if not click_success:
+                    self.logger.error("❌ Click execution failed: input was not accepted by the OS")
             else:
                 # Simulate click for testing
-                self.logger.info(f"🖱️  [SIMULATED] Clicked at {point} with {button}")
-            
-            return True
-            
+                self.logger.info(f"🖱️  [SIMULATED] Clicked at {target} with {button}")
+                click_success = True
         except Exception as e:
             self.logger.error(f"❌ Click execution failed: {e}")
-            return False
-    
-    def _post_click_behavior(self, click_success: bool):
-        """Execute post-click behavior"""
+            click_success = False
+        
         # Post-click delay
-        post_delay = self.random_helper.get_click_delay(0.05, 0.2)
-        time.sleep(post_delay)
+        sleep(self._tape_post_delay[i])
         
         # Occasional double-check (move mouse slightly away and back)
-        if (click_success and self.random_helper.should_double_check() and 
-            self.settings.automation.anti_detection):
-            
-            current_pos = self.get_current_position()
+        if click_success and anti_detect and self._tape_double_check[i]:
+            current_pos = st.current_position
             away_point = self.coordinate_helper.offset_coordinates(
                 current_pos.x, current_pos.y, max_offset=20
             )
             
             # Quick move away and back
             self._move_directly_to_target(away_point)
-            time.sleep(0.1)
+            sleep(0.1)
             self._move_directly_to_target(current_pos)
-            
-            log_detection("post_click_doublecheck", "Performed double-check movement", "INFO")
+            defer_log("detection", "post_click_doublecheck", "INFO", "Performed double-check movement")
+        
+        self._record_click(t_start)
+        
+        return click_success
+    
+    def _record_click(self, t_click: float):
+        """Update click statistics (clicks per minute as an exponential moving average)"""
+        st = self.state
+        dt = t_click - st.last_click_time
+        if dt > 0:
+            self._cpm_ema = 0.9 * self._cpm_ema + 0.1 * (60.0 / dt)
+        st.total_clicks += 1
+        st.last_click_time = t_click
     
     def _execute_drag(self, start: Point, end: Point, duration: float) -> bool:
         """Execute drag operation"""
@@ -720,16 +987,14 @@ class MouseController:
     def _execute_scroll(self, x: int, y: int, amount: int, horizontal: bool = False) -> bool:
         """Execute scroll operation"""
         try:
-            if PYAUTOGUI_AVAILABLE:
-                # Move to position first if not already there
-                current_pos = self.get_current_position()
-                if current_pos.distance_to(Point(x, y)) > 5:
-                    pyautogui.moveTo(x, y)
+            if self._input_available:
+                # Move to position first unless the tracked cursor is already there
+                current_pos = self.state.current_position
+                if current_pos.x != x or current_pos.y != y:
+                    self._os_move_to(x, y)
+                    self.state.current_position = Point(x, y)
                 
-                if horizontal:
-                    pyautogui.hscroll(amount)
-                else:
-                    pyautogui.scroll(amount)
+                self._os_scroll(amount, horizontal)
             else:
                 direction = "horizontal" if horizontal else "vertical"
                 self.logger.info(f"🖱️  [SIMULATED] Scrolled {direction}: {amount} at ({x}, {y})")
@@ -740,14 +1005,81 @@ class MouseController:
             self.logger.error(f"❌ Scroll execution failed: {e}")
             return False
     
+    # Deferred logging
+    
+    def _defer_log(self, kind: str, event: str, extra: Any, template: str, *args):
+        """
+        Queue a log record without formatting it.
+        
+        Args:
+            kind: "mouse", "action" or "detection"
+            event: Event/action name
+            extra: Coordinates (mouse), success flag (action) or risk level (detection)
+            template: str.format template for the details
+            *args: Values for the template
+        """
+        _queue_log_record((time.time(), kind, event, extra, template, args))
+    
+    def flush_logs(self):
+        """Format and emit all queued log records"""
+        flush_mouse_logs()
+    
+    def close(self):
+        """Emit remaining log records (the shared flusher keeps running for other controllers)"""
+        flush_mouse_logs()
+    
+    # Low-level input (native backend first, pyautogui fallback)
+    
+    def _os_position(self) -> Tuple[int, int]:
+        """Read the cursor position from the active input backend"""
+        if self._native:
+            return native_mouse.get_pos()
+        pos = pyautogui.position()
+        return pos.x, pos.y
+    
+    def _os_move_to(self, x: int, y: int):
+        """Move the cursor with the active input backend"""
+        if self._native:
+            native_mouse.move_to(x, y)
+        else:
+            pyautogui.moveTo(x, y)
+    
+    def _os_click(self, button: str) -> bool:
+        """Click at the current cursor position with the active input backend"""
+        if self._native:
+            return native_mouse.click(button)
+        pyautogui.click(button=button)
+        return True
+    
+    def _os_double_click(self, button: str) -> bool:
+        """Double-click at the current cursor position with the active input backend"""
+        if self._native:
+            return native_mouse.double_click(button)
+        pyautogui.doubleClick(button=button)
+        return True
+    
+    def _os_scroll(self, amount: int, horizontal: bool = False):
+        """Scroll with the active input backend"""
+        if self._native:
+            if horizontal:
+                native_mouse.scroll(dx=amount)
+            else:
+                native_mouse.scroll(dy=amount)
+        elif horizontal:
+            pyautogui.hscroll(amount)
+        else:
+            pyautogui.scroll(amount)
+    
     def emergency_stop(self):
         """Emergency stop all mouse operations"""
         try:
             self.state.is_dragging = False
-            if PYAUTOGUI_AVAILABLE:
+            self._pos_dirty = True
+            if self._input_available:
                 # Move mouse to safe corner
-                pyautogui.moveTo(10, 10)
+                self._os_move_to(10, 10)
             
+            self.flush_logs()
             self.logger.warning("🛑 Emergency stop - Mouse operations halted")
             log_action("emergency_stop", "Mouse operations emergency stopped", True)
             
@@ -6,12 +6,25 @@ Specialized controller for keyword research and text manipulation operations
 import time
 import random
 import platform
+from functools import partial
+import numpy as np
 import pyautogui
+from concurrent.futures import ThreadPoolExecutor
+
+# Native input events (Quartz on macOS, SendInput on Windows, XTest on Linux)
+try:
+    from pynput.mouse import Controller as PynputMouse, Button
+    from pynput.keyboard import Controller as PynputKeyboard, Key
+    PYNPUT_AVAILABLE = True
+except ImportError:
+    PYNPUT_AVAILABLE = False
 
 # Import our simplified utilities
 from utils.browser_utils import (
     quick_open_chrome,
     wait_for_page_load,
+    wait_for_screen_settle,
+    screen_settled_probe,
     close_browser_process,
     setup_pyautogui_safety,
     get_screen_center
@@ -29,10 +42,48 @@ from config.keywords_config import (
     get_available_sequences,
     get_available_areas,
     validate_sequence,
-    validate_area,
-    get_sequence_info
+    validate_area
 )
 
+# Timing is handled explicitly below; don't add pyautogui's implicit pause per call
+pyautogui.PAUSE = 0
+
+# pyautogui key names that differ in pynput
+_PYNPUT_KEY_NAMES = {
+    'escape': 'esc',
+    'return': 'enter',
+    'del': 'delete',
+    'pageup': 'page_up',
+    'pagedown': 'page_down',
+    'command': 'cmd',
+    'win': 'cmd',
+}
+
+def _quiet(*args, **kwargs):
+    """Stand-in for print when progress output is disabled"""
+
+def precise_sleep(duration, margin=0.002):
+    """
+    Sleep for duration seconds: coarse time.sleep, then spin on perf_counter
+    for the last margin seconds to avoid scheduler oversleep.
+    """
+    deadline = time.perf_counter() + duration
+    coarse = duration - margin
+    if coarse > 0:
+        time.sleep(coarse)
+    while time.perf_counter() < deadline:
+        pass
+
+def _area_bounds(coords):
+    """Normalize (x1, y1, x2, y2) to (min_x, max_x, min_y, max_y)"""
+    x1, y1, x2, y2 = coords
+    return min(x1, x2), max(x1, x2), min(y1, y2), max(y1, y2)
+
+# Click area bounds are static config: normalize them once at import
+_NORMALIZED_AREAS = {name: _area_bounds(area['coordinates']) for name, area in CLICK_AREAS.items()}
+for _name, _bounds in _NORMALIZED_AREAS.items():
+    CLICK_AREAS[_name]['_bounds'] = _bounds
+
 # =============================================================================
 
 class KeywordsSearchController:
@@ -40,17 +91,54 @@ class KeywordsSearchController:
     Advanced controller for keyword research operations with natural timing and human behaviors
     """
     
-    def __init__(self):
+    # Keystroke delays at or below this are not slept individually
+    TYPING_JITTER_THRESHOLD = 0.01
+    
+    def __init__(self, verbose=True):
+        """
+        Args:
+            verbose: Print per-action progress (errors are always printed)
+        """
         self.browser_process = None
         self.clipboard_content = ""
+        self.verbose = verbose
+        self._print = print if verbose else _quiet
+        
+        # We manage all timing ourselves: no implicit pauses, failsafe stays on
+        pyautogui.PAUSE = 0
+        pyautogui.MINIMUM_DURATION = 0
+        pyautogui.MINIMUM_SLEEP = 0
+        pyautogui.FAILSAFE = True
+        
+        # Private RNGs for click/drag target sampling and vectorized typing decisions
+        self._rng = random.Random()
+        self._rng_np = np.random.default_rng()
+        
+        # Modifier for select/copy/paste shortcuts, resolved once
+        self._cmd_key = 'cmd' if platform.system() == "Darwin" else 'ctrl'
+        
+        # Settle time after copy/paste so the clipboard is ready for the next action
+        self._post_hotkey_delay = 0.3
+        
+        # Clicks and keys go through pynput when available; pyautogui is the fallback
+        if PYNPUT_AVAILABLE:
+            self._mouse = PynputMouse()
+            self._kb = PynputKeyboard()
+        else:
+            self._mouse = None
+            self._kb = None
         
         # Initialize RandomHelper with casual behavioral profile
         self.random_helper = RandomHelper(create_casual_profile())
         self.random_helper.behavior_profile.mistake_proneness = 0.0  # Disable errors for reliability
         
-        print("🔍 Keywords Search Controller initialized")
-        print("🧠 Human behavior profile: Casual User (Errors DISABLED)")
-        print("📝 Specialized in text operations and keyword research")
+        # Pre-bound delay samplers for the click hot path
+        self._move_delay_sampler = partial(self.random_helper.get_click_delay, 0.3, 0.8)
+        self._preclick_delay_sampler = partial(self.random_helper.get_click_delay, 0.1, 0.3)
+        
+        self._print("🔍 Keywords Search Controller initialized")
+        self._print("🧠 Human behavior profile: Casual User (Errors DISABLED)")
+        self._print("📝 Specialized in text operations and keyword research")
     
     def click_in_area(self, area_config, area_name="", click_type="single"):
         """
@@ -62,39 +150,37 @@ class KeywordsSearchController:
             click_type: Type of click - 'single', 'double', 'triple'
         """
         try:
-            coords = area_config['coordinates']
-            x1, y1, x2, y2 = coords
-            
-            # Ensure coordinates are in correct order
-            min_x, max_x = min(x1, x2), max(x1, x2)
-            min_y, max_y = min(y1, y2), max(y1, y2)
+            # Bounds are precomputed for configured areas
+            bounds = area_config.get('_bounds') or _area_bounds(area_config['coordinates'])
+            min_x, max_x, min_y, max_y = bounds
             
             # Generate random point in area
-            click_x = random.randint(min_x, max_x)
-            click_y = random.randint(min_y, max_y)
+            randrange = self._rng.randrange
+            click_x = randrange(min_x, max_x + 1)
+            click_y = randrange(min_y, max_y + 1)
             
-            print(f"🎯 {click_type.capitalize()} clicking in {area_name}")
-            print(f"   • Area: ({min_x}, {min_y}) to ({max_x}, {max_y})")
-            print(f"   • Click point: ({click_x}, {click_y})")
+            self._print(f"🎯 {click_type.capitalize()} clicking in {area_name}")
+            self._print(f"   • Area: ({min_x}, {min_y}) to ({max_x}, {max_y})")
+            self._print(f"   • Click point: ({click_x}, {click_y})")
             
             # Move to position with natural timing
-            move_duration = self.random_helper.get_click_delay(0.3, 0.8)
-            pyautogui.moveTo(click_x, click_y, duration=move_duration)
+            move_duration = self._move_delay_sampler()
+            self._ease_move(click_x, click_y, move_duration)
             
             # Small pause before clicking
-            pre_click_pause = self.random_helper.get_click_delay(0.1, 0.3)
+            pre_click_pause = self._preclick_delay_sampler()
             time.sleep(pre_click_pause)
             
             # Execute click based on type
             if click_type == "double":
-                pyautogui.doubleClick()
-                print(f"✅ Double-clicked successfully in {area_name}")
+                self._click(2)
+                self._print(f"✅ Double-clicked successfully in {area_name}")
             elif click_type == "triple":
-                pyautogui.tripleClick()
-                print(f"✅ Triple-clicked successfully in {area_name}")
+                self._click(3)
+                self._print(f"✅ Triple-clicked successfully in {area_name}")
             else:
-                pyautogui.click()
-                print(f"✅ Single-clicked successfully in {area_name}")
+                self._click(1)
+                self._print(f"✅ Single-clicked successfully in {area_name}")
             
             return True
             
@@ -107,13 +193,9 @@ class KeywordsSearchController:
         Select all text (Ctrl+A or Cmd+A)
         """
         try:
-            print("📋 Selecting all text...")
-            if platform.system() == "Darwin":  # macOS
-                pyautogui.hotkey('cmd', 'a')
-            else:  # Windows/Linux
-                pyautogui.hotkey('ctrl', 'a')
-            time.sleep(0.3)
-            print("✅ Select all executed")
+            self._print("📋 Selecting all text...")
+            self._hotkey(self._cmd_key, 'a')
+            self._print("✅ Select all executed")
             return True
         except Exception as e:
             print(f"❌ Select all failed: {e}")
@@ -124,12 +206,12 @@ class KeywordsSearchController:
         Clear current field by selecting all and deleting
         """
         try:
-            print("🧹 Clearing field...")
+            self._print("🧹 Clearing field...")
             self.select_all_text()
             time.sleep(0.2)
-            pyautogui.press('delete')
-            time.sleep(0.2)
-            print("✅ Field cleared")
+            self._press('delete')
+            wait_for_screen_settle(timeout=0.2)
+            self._print("✅ Field cleared")
             return True
         except Exception as e:
             print(f"❌ Clear field failed: {e}")
@@ -140,15 +222,12 @@ class KeywordsSearchController:
         Copy selected text to clipboard
         """
         try:
-            print("📄 Copying text to clipboard...")
-            if platform.system() == "Darwin":  # macOS
-                pyautogui.hotkey('cmd', 'c')
-            else:  # Windows/Linux
-                pyautogui.hotkey('ctrl', 'c')
+            self._print("📄 Copying text to clipboard...")
+            self._hotkey(self._cmd_key, 'c')
             
             # Small delay to ensure copy operation completes
-            time.sleep(0.5)
-            print("✅ Text copied to clipboard")
+            time.sleep(self._post_hotkey_delay)
+            self._print("✅ Text copied to clipboard")
             return True
         except Exception as e:
             print(f"❌ Copy text failed: {e}")
@@ -159,14 +238,12 @@ class KeywordsSearchController:
         Paste text from clipboard
         """
         try:
-            print("📝 Pasting text from clipboard...")
-            if platform.system() == "Darwin":  # macOS
-                pyautogui.hotkey('cmd', 'v')
-            else:  # Windows/Linux
-                pyautogui.hotkey('ctrl', 'v')
-            
-            time.sleep(0.3)
-            print("✅ Text pasted successfully")
+            self._print("📝 Pasting text from clipboard...")
+            self._hotkey(self._cmd_key, 'v')
+            
+            # Return as soon as the pasted text is on screen
+            wait_for_screen_settle(timeout=self._post_hotkey_delay)
+            self._print("✅ Text pasted successfully")
             return True
         except Exception as e:
             print(f"❌ Paste text failed: {e}")
@@ -177,7 +254,7 @@ class KeywordsSearchController:
         Double-click to select a word in the specified area
         """
         try:
-            print(f"🔤 Selecting word in {area_name}")
+            self._print(f"🔤 Selecting word in {area_name}")
             return self.click_in_area(area_config, area_name, "double")
         except Exception as e:
             print(f"❌ Word selection failed in {area_name}: {e}")
@@ -188,7 +265,7 @@ class KeywordsSearchController:
         Triple-click to select a paragraph in the specified area
         """
         try:
-            print(f"📄 Selecting paragraph in {area_name}")
+            self._print(f"📄 Selecting paragraph in {area_name}")
             return self.click_in_area(area_config, area_name, "triple")
         except Exception as e:
             print(f"❌ Paragraph selection failed in {area_name}: {e}")
@@ -202,14 +279,14 @@ class KeywordsSearchController:
             key: Key to press (e.g., 'enter', 'tab', 'escape')
         """
         try:
-            print(f"⌨️ Pressing key: {key}")
-            pyautogui.press(key)
+            self._print(f"⌨️ Pressing key: {key}")
+            self._press(key)
             
             # Natural delay after key press
             key_delay = self.random_helper.get_typing_delay()
             time.sleep(key_delay)
             
-            print(f"✅ Key '{key}' pressed")
+            self._print(f"✅ Key '{key}' pressed")
             return True
         except Exception as e:
             print(f"❌ Key press failed for '{key}': {e}")
@@ -223,21 +300,28 @@ class KeywordsSearchController:
             text: Text to type
         """
         try:
-            print(f"⌨️ Typing naturally: '{text}'")
-            
-            for i, char in enumerate(text):
-                pyautogui.write(char)
+            self._print(f"⌨️ Typing naturally: '{text}'")
+            
+            # Natural delay per character, drawn up front
+            n = len(text)
+            char_delays = self.random_helper.get_typing_delays(text).tolist()
+            
+            # Split into segments at the occasional brief pauses for natural rhythm
+            positions = np.arange(n)
+            pause_mask = (positions % 5 == 0) & (positions > 0) & (self._rng_np.random(n) < 0.3)
+            breaks = (np.flatnonzero(pause_mask) + 1).tolist()
+            bounds = [0] + breaks + [n]
+            
+            for seg_start, seg_end in zip(bounds, bounds[1:]):
+                if seg_end <= seg_start:
+                    continue
+                self._type(text[seg_start:seg_end], char_delays[seg_start:seg_end])
                 
-                # Natural delay based on character
-                char_delay = self.random_helper.get_typing_delay(char=char)
-                time.sleep(char_delay)
-                
-                # Occasional brief pauses for natural rhythm
-                if i > 0 and i % 5 == 0 and random.random() < 0.3:
+                if seg_end < len(text):
                     brief_pause = self.random_helper.get_word_pause(len(text))
                     time.sleep(brief_pause)
             
-            print(f"✅ Typed naturally: '{text}'")
+            self._print(f"✅ Typed naturally: '{text}'")
             return True
         except Exception as e:
             print(f"❌ Natural typing failed: {e}")
@@ -252,142 +336,190 @@ class KeywordsSearchController:
             end_area: Ending area configuration
         """
         try:
-            print("🖱️ Performing drag selection...")
+            self._print("🖱️ Performing drag selection...")
             
             # Get random points in both areas
-            start_coords = start_area['coordinates']
-            end_coords = end_area['coordinates']
+            start_bounds = start_area.get('_bounds') or _area_bounds(start_area['coordinates'])
+            end_bounds = end_area.get('_bounds') or _area_bounds(end_area['coordinates'])
             
-            start_x = random.randint(start_coords[0], start_coords[2])
-            start_y = random.randint(start_coords[1], start_coords[3])
+            randrange = self._rng.randrange
+            start_x = randrange(start_bounds[0], start_bounds[1] + 1)
+            start_y = randrange(start_bounds[2], start_bounds[3] + 1)
             
-            end_x = random.randint(end_coords[0], end_coords[2])
-            end_y = random.randint(end_coords[1], end_coords[3])
+            end_x = randrange(end_bounds[0], end_bounds[1] + 1)
+            end_y = randrange(end_bounds[2], end_bounds[3] + 1)
             
-            print(f"   • Drag from: ({start_x}, {start_y})")
-            print(f"   • Drag to: ({end_x}, {end_y})")
+            self._print(f"   • Drag from: ({start_x}, {start_y})")
+            self._print(f"   • Drag to: ({end_x}, {end_y})")
             
             # Move to start position
-            pyautogui.moveTo(start_x, start_y, duration=0.5)
+            self._ease_move(start_x, start_y, 0.5)
             time.sleep(0.2)
             
-            # Perform drag
-            pyautogui.dragTo(end_x, end_y, duration=1.0, button='left')
-            time.sleep(0.3)
-            
-            print("✅ Drag selection completed")
+            # Perform drag as one eased stream of moves with the button held
+            self._button(pressed=True)
+            try:
+                self._ease_move(end_x, end_y, 1.0, steps=20)
+            finally:
+                self._button(pressed=False)
+            min_x, max_x, min_y, max_y = end_bounds
+            wait_for_screen_settle(region=(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1),
+                                   timeout=0.3)
+            
+            self._print("✅ Drag selection completed")
             return True
             
         except Exception as e:
             print(f"❌ Drag selection failed: {e}")
             return False
     
-    def execute_single_action(self, action):
+    def _compile_action(self, action):
         """
-        Execute a single action with natural timing
+        Resolve an action's handler and area references once
         
         Args:
             action: Dict with action details
             
         Returns:
-            bool: True if action succeeded
+            tuple: (handler, compiled_action), or None if the action is invalid
+        """
+        action_type = action['type']
+        handler = _ACTION_HANDLERS.get(action_type)
+        if handler is None:
+            print(f"❌ Unknown action type: {action_type}")
+            return None
+        
+        compiled = dict(action)
+        if action_type in _AREA_ACTION_TYPES:
+            area_name = action['area']
+            if area_name not in CLICK_AREAS:
+                print(f"❌ Area '{area_name}' not found")
+                return None
+            area_config = CLICK_AREAS[area_name]
+            compiled['area_config'] = area_config
+            compiled['area_display'] = area_config['name']
+        
+        elif action_type == "drag_select":
+            start_area = action.get('start_area')
+            end_area = action.get('end_area')
+            if not (start_area and end_area and start_area in CLICK_AREAS and end_area in CLICK_AREAS):
+                print(f"❌ Invalid drag areas: {start_area} -> {end_area}")
+                return None
+            compiled['start_area_config'] = CLICK_AREAS[start_area]
+            compiled['end_area_config'] = CLICK_AREAS[end_area]
+        
+        return handler, compiled
+    
+    def _compile_sequence(self, sequence):
+        """
+        Compile all actions of a sequence, validating areas upfront.
+        The result is cached on the sequence as '_compiled'.
+        
+        Returns:
+            list: (handler, compiled_action) pairs, or None if any action is invalid
+        """
+        compiled = sequence.get('_compiled')
+        if compiled is not None:
+            return compiled
+        
+        compiled = []
+        for i, action in enumerate(sequence['actions']):
+            entry = self._compile_action(action)
+            if entry is None:
+                print(f"❌ Invalid action at step {i+1}")
+                return None
+            compiled.append(entry)
+        
+        sequence['_compiled'] = compiled
+        return compiled
+    
+    def _plan_hesitations(self, compiled):
+        """
+        Decide pre-action hesitations for a whole compiled sequence in one pass
+        
+        Returns:
+            list: Hesitation seconds per step (0.0 = no hesitation)
+        """
+        p_hes = self.random_helper.hesitation_prob("normal")
+        get_pause = self.random_helper.get_natural_pause
+        rand = random.random
+        return [
+            get_pause("hesitation") if action['type'] in _HESITATION_ACTION_TYPES and rand() < p_hes else 0.0
+            for _, action in compiled
+        ]
+    
+    def _compile_all_sequences(self, sequence_names):
+        """
+        Validate and compile every named sequence ahead of execution
+        
+        Returns:
+            bool: True if all sequences are valid
+        """
+        for sequence_name in sequence_names:
+            is_valid, message = validate_sequence(sequence_name)
+            if not is_valid:
+                print(f"❌ {message}")
+                return False
+            if self._compile_sequence(ACTION_SEQUENCES[sequence_name]) is None:
+                print(f"❌ Sequence '{sequence_name}' has invalid actions")
+                return False
+        return True
+    
+    def _run_compiled_action(self, handler, action, hesitation=None):
+        """
+        Run a compiled action with natural pre-action hesitation
+        
+        Args:
+            handler: Handler from _ACTION_HANDLERS
+            action: Compiled action
+            hesitation: Planned hesitation in seconds (None = decide now)
         """
         try:
-            action_type = action['type']
-            
             # Possibility of hesitation before action
-            if action_type in ['click_area', 'type_text', 'double_click', 'triple_click']:
-                if self.random_helper.should_hesitate("normal"):
+            if hesitation is None:
+                hesitation = 0.0
+                if action['type'] in _HESITATION_ACTION_TYPES and self.random_helper.should_hesitate("normal"):
                     hesitation = self.random_helper.get_natural_pause("hesitation")
-                    print(f"   🤔 Pre-action hesitation: {hesitation:.1f}s")
-                    time.sleep(hesitation)
-            
-            # Execute based on action type
-            if action_type == "click_area":
-                area_name = action['area']
-                if area_name in CLICK_AREAS:
-                    return self.click_in_area(CLICK_AREAS[area_name], CLICK_AREAS[area_name]['name'], "single")
-                else:
-                    print(f"❌ Area '{area_name}' not found")
-                    return False
-            
-            elif action_type == "double_click":
-                area_name = action['area']
-                if area_name in CLICK_AREAS:
-                    return self.click_in_area(CLICK_AREAS[area_name], CLICK_AREAS[area_name]['name'], "double")
-                else:
-                    print(f"❌ Area '{area_name}' not found")
-                    return False
-            
-            elif action_type == "triple_click":
-                area_name = action['area']
-                if area_name in CLICK_AREAS:
-                    return self.click_in_area(CLICK_AREAS[area_name], CLICK_AREAS[area_name]['name'], "triple")
-                else:
-                    print(f"❌ Area '{area_name}' not found")
-                    return False
-            
-            elif action_type == "select_all":
-                return self.select_all_text()
             
-            elif action_type == "clear_field":
-                return self.clear_field()
+            if hesitation:
+                self._print(f"   🤔 Pre-action hesitation: {hesitation:.1f}s")
+                time.sleep(hesitation)
             
-            elif action_type == "copy_text":
-                return self.copy_text()
-            
-            elif action_type == "paste_text":
-                return self.paste_text()
-            
-            elif action_type == "select_word":
-                area_name = action['area']
-                if area_name in CLICK_AREAS:
-                    return self.select_word(CLICK_AREAS[area_name], CLICK_AREAS[area_name]['name'])
-                else:
-                    print(f"❌ Area '{area_name}' not found")
-                    return False
-            
-            elif action_type == "select_paragraph":
-                area_name = action['area']
-                if area_name in CLICK_AREAS:
-                    return self.select_paragraph(CLICK_AREAS[area_name], CLICK_AREAS[area_name]['name'])
-                else:
-                    print(f"❌ Area '{area_name}' not found")
-                    return False
-            
-            elif action_type == "type_text":
-                text = action['text']
-                return self.type_text_naturally(text)
-            
-            elif action_type == "press_key":
-                key = action['key']
-                return self.press_key(key)
-            
-            elif action_type == "wait":
-                seconds = action.get('seconds', 1)
-                natural_wait = seconds + random.uniform(-0.2, 0.5)
-                natural_wait = max(0.1, natural_wait)
-                print(f"⏸️ Natural wait: {natural_wait:.1f}s")
-                time.sleep(natural_wait)
-                return True
-            
-            elif action_type == "drag_select":
-                start_area = action.get('start_area')
-                end_area = action.get('end_area')
-                if start_area and end_area and start_area in CLICK_AREAS and end_area in CLICK_AREAS:
-                    return self.mouse_drag_select(CLICK_AREAS[start_area], CLICK_AREAS[end_area])
-                else:
-                    print(f"❌ Invalid drag areas: {start_area} -> {end_area}")
-                    return False
+            return handler(self, action)
+                
+        except Exception as e:
+            print(f"❌ Action execution failed: {e}")
+            return False
+    
+    def execute_single_action(self, action):
+        """
+        Execute a single action with natural timing
+        
+        Args:
+            action: Dict with action details
             
-            else:
-                print(f"❌ Unknown action type: {action_type}")
+        Returns:
+            bool: True if action succeeded
+        """
+        try:
+            entry = self._compile_action(action)
+            if entry is None:
                 return False
+            return self._run_compiled_action(*entry)
                 
         except Exception as e:
             print(f"❌ Action execution failed: {e}")
             return False
     
+    def _natural_wait(self, action):
+        """Wait handler: configured seconds with natural variation"""
+        seconds = action.get('seconds', 1)
+        natural_wait = seconds + random.uniform(-0.2, 0.5)
+        natural_wait = max(0.1, natural_wait)
+        self._print(f"⏸️ Natural wait: {natural_wait:.1f}s")
+        precise_sleep(natural_wait)
+        return True
+    
     def execute_action_sequence(self, sequence_name):
         """
         Execute a defined action sequence
@@ -406,31 +538,45 @@ class KeywordsSearchController:
                 return False
             
             sequence = ACTION_SEQUENCES[sequence_name]
-            print(f"🎬 Executing sequence: {sequence['name']}")
-            print(f"   Actions: {len(sequence['actions'])}")
+            compiled = self._compile_sequence(sequence)
+            if compiled is None:
+                print(f"❌ Sequence '{sequence_name}' has invalid actions")
+                return False
             
-            for i, action in enumerate(sequence['actions']):
-                print(f"\n   📍 Step {i+1}/{len(sequence['actions'])}: {action['type']}")
+            total = len(compiled)
+            hesitations = self._plan_hesitations(compiled)
+            self._print(f"🎬 Executing sequence: {sequence['name']}")
+            self._print(f"   Actions: {total}")
+            
+            for i, (handler, action) in enumerate(compiled):
+                self._print(f"\n   📍 Step {i+1}/{total}: {action['type']}")
                 
                 # Execute the action
-                success = self.execute_single_action(action)
+                success = self._run_compiled_action(handler, action, hesitations[i])
                 if not success:
                     print(f"❌ Sequence failed at step {i+1}")
                     return False
                 
+                # Consecutive click actions run back to back with one settle at the end
+                if action['type'] in _CHAIN_ACTION_TYPES:
+                    if i + 1 == total or compiled[i + 1][1]['type'] not in _CHAIN_ACTION_TYPES:
+                        if wait_for_screen_settle():
+                            self._print("   ⏸️ Screen settled after chain")
+                    continue
+                
                 # Natural wait after action if specified
                 if 'wait_min' in action and 'wait_max' in action:
                     wait_time = self.random_helper.get_click_delay(action['wait_min'], action['wait_max'])
-                    print(f"   ⏸️ Natural wait: {wait_time:.2f}s (range: {action['wait_min']}-{action['wait_max']})")
-                    time.sleep(wait_time)
+                    self._print(f"   ⏸️ Natural wait: {wait_time:.2f}s (range: {action['wait_min']}-{action['wait_max']})")
+                    precise_sleep(wait_time)
                 elif 'wait' in action:
                     # Fallback for old format
                     wait_time = action['wait'] + random.uniform(-0.2, 0.3)
                     wait_time = max(0.1, wait_time)
-                    print(f"   ⏸️ Natural wait: {wait_time:.2f}s")
-                    time.sleep(wait_time)
+                    self._print(f"   ⏸️ Natural wait: {wait_time:.2f}s")
+                    precise_sleep(wait_time)
             
-            print(f"✅ Sequence '{sequence['name']}' completed successfully")
+            self._print(f"✅ Sequence '{sequence['name']}' completed successfully")
             return True
             
         except Exception as e:
@@ -440,12 +586,9 @@ class KeywordsSearchController:
     def list_available_sequences(self):
         """Show all available sequences"""
         print("\n🎬 Available Action Sequences:")
-        for seq_name in get_available_sequences():
-            seq_info = get_sequence_info(seq_name)
-            if seq_info:
-                print(f"   • {seq_name}: {seq_info['name']} ({seq_info['action_count']} actions)")
-                if seq_info.get('description'):
-                    print(f"     {seq_info['description']}")
+        for seq_name, seq in ACTION_SEQUENCES.items():
+            print(f"   • {seq_name}: {seq.get('name', seq_name)} ({len(seq['actions'])} actions)")
+            print(f"     {seq.get('description', 'No description available')}")
     
     def list_available_areas(self):
         """Show all available click areas"""
@@ -466,16 +609,16 @@ class KeywordsSearchController:
             sequences: List of sequences to execute (defaults to basic workflow)
         """
         try:
-            print("🔍 Starting Keywords Search operations with Action Sequences...")
-            print("="*60)
+            self._print("🔍 Starting Keywords Search operations with Action Sequences...")
+            self._print("="*60)
             
             # Step 1: Setup pyautogui safety
-            print("🔧 Setting up safety configurations...")
+            self._print("🔧 Setting up safety configurations...")
             setup_pyautogui_safety()
             
             # Step 2: Open browser using configuration
             target_url = url or DEFAULT_URL
-            print("🌐 Opening positioned browser...")
+            self._print("🌐 Opening positioned browser...")
             self.browser_process = quick_open_chrome(
                 url=target_url,
                 position=BROWSER_CONFIG["position"],
@@ -486,18 +629,32 @@ class KeywordsSearchController:
                 print("❌ Failed to open browser")
                 return False
             
-            # Step 3: Wait for loading
-            print("⏳ Waiting for page load...")
-            wait_for_page_load(BROWSER_CONFIG["page_load_timeout"], show_progress=True)
-            
-            # Step 4: Show available sequences if none specified
+            # Step 3: Show available sequences if none specified
             if not sequences:
                 self.list_available_sequences()
                 sequences = ["basic_search", "text_selection_copy"]  # Default workflow
             
+            # Step 4: Wait for loading (stable for a second) while compiling sequences
+            self._print("⏳ Waiting for page load...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                page_load = executor.submit(
+                    wait_for_page_load,
+                    BROWSER_CONFIG["page_load_timeout"],
+                    show_progress=False,
+                    readiness_fn=screen_settled_probe(stable_polls=4, min_wait=1.0),
+                    poll_interval=0.25,
+                    verbose=False
+                )
+                compiled = executor.submit(self._compile_all_sequences, sequences)
+                
+                if page_load.result():
+                    self._print("   ✅ Page rendered and stable")
+                if not compiled.result():
+                    return False
+            
             # Step 5: Execute specified sequences
             for i, sequence_name in enumerate(sequences):
-                print(f"\n🎬 Step {i+1}: Executing sequence '{sequence_name}'")
+                self._print(f"\n🎬 Step {i+1}: Executing sequence '{sequence_name}'")
                 
                 if not self.execute_action_sequence(sequence_name):
                     print(f"❌ Failed at sequence '{sequence_name}'")
@@ -506,11 +663,11 @@ class KeywordsSearchController:
                 # Brief pause between sequences
                 if i < len(sequences) - 1:
                     inter_sequence_pause = self.random_helper.get_click_delay(2.0, 4.0)
-                    print(f"⏳ Inter-sequence pause: {inter_sequence_pause:.1f}s")
-                    time.sleep(inter_sequence_pause)
+                    self._print(f"⏳ Inter-sequence pause: {inter_sequence_pause:.1f}s")
+                    precise_sleep(inter_sequence_pause)
             
-            print("\n🎉 All keyword search sequences completed successfully!")
-            print("✅ Keywords Search automation finished!")
+            self._print("\n🎉 All keyword search sequences completed successfully!")
+            self._print("✅ Keywords Search automation finished!")
             
             return True
             
@@ -518,12 +675,144 @@ class KeywordsSearchController:
             print(f"❌ Workflow failed: {e}")
             return False
     
+    # Input backend
+    
+    def _click(self, count=1):
+        """Click the left button count times at the current cursor position"""
+        if self._mouse is not None:
+            self._mouse.click(Button.left, count)
+        else:
+            pyautogui.click(clicks=count)
+    
+    def _button(self, pressed):
+        """Press or release the left mouse button at the current position"""
+        if self._mouse is not None:
+            if pressed:
+                self._mouse.press(Button.left)
+            else:
+                self._mouse.release(Button.left)
+        elif pressed:
+            pyautogui.mouseDown(button='left')
+        else:
+            pyautogui.mouseUp(button='left')
+    
+    def _cursor_position(self):
+        """Current cursor position"""
+        if self._mouse is not None:
+            return self._mouse.position
+        return pyautogui.position()
+    
+    def _move_cursor(self, x, y):
+        """Move the cursor to (x, y) immediately"""
+        if self._mouse is not None:
+            self._mouse.position = (x, y)
+        else:
+            pyautogui.moveTo(x, y)
+    
+    def _ease_move(self, x, y, duration, steps=None):
+        """
+        Move the cursor to (x, y) along a cubic ease-in-out over duration seconds
+        
+        Args:
+            x, y: Target coordinates
+            duration: Movement time in seconds
+            steps: Intermediate positions (3-40 by distance if None)
+        """
+        x1, y1 = self._cursor_position()
+        dx, dy = x - x1, y - y1
+        if steps is None:
+            steps = max(3, min(40, int((dx * dx + dy * dy) ** 0.5 / 20)))
+        
+        start = time.perf_counter()
+        for k in range(1, steps + 1):
+            t = k / steps
+            f = 3 * t * t - 2 * t * t * t
+            self._move_cursor(round(x1 + dx * f), round(y1 + dy * f))
+            
+            # Sleep to each step's deadline so per-step overhead doesn't accumulate
+            remaining = start + duration * t - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+    
+    def _resolve_key(self, key):
+        """Map a pyautogui key name to a pynput key"""
+        if len(key) == 1:
+            return key
+        name = _PYNPUT_KEY_NAMES.get(key, key)
+        return getattr(Key, name)
+    
+    def _hotkey(self, modifier, key):
+        """Press key while holding modifier (e.g. 'cmd' + 'a')"""
+        if self._kb is not None:
+            with self._kb.pressed(self._resolve_key(modifier)):
+                self._kb.tap(self._resolve_key(key))
+        else:
+            pyautogui.hotkey(modifier, key)
+    
+    def _press(self, key):
+        """Press and release a single key"""
+        if self._kb is not None:
+            self._kb.tap(self._resolve_key(key))
+        else:
+            pyautogui.press(key)
+    
+    def _type(self, text, delays):
+        """
+        Type text, sleeping each character's delay after it
+        
+        Args:
+            text: Text to type
+            delays: Per-character delays in seconds (same length as text)
+        """
+        if self._kb is None:
+            # typewrite only supports a fixed interval
+            pyautogui.typewrite(text, interval=sum(delays) / len(delays))
+            return
+        
+        # Characters without a meaningful delay are sent in one call
+        threshold = self.TYPING_JITTER_THRESHOLD
+        kb_type = self._kb.type
+        run_start = 0
+        for i, delay in enumerate(delays):
+            if delay > threshold:
+                kb_type(text[run_start:i + 1])
+                time.sleep(delay)
+                run_start = i + 1
+        if run_start < len(text):
+            kb_type(text[run_start:])
+    
     def cleanup(self):
         """Close browser using utilities"""
         if self.browser_process:
-            print("🧹 Cleaning up...")
+            self._print("🧹 Cleaning up...")
             close_browser_process(self.browser_process)
 
+# Actions that target a single click area
+_AREA_ACTION_TYPES = frozenset({'click_area', 'double_click', 'triple_click', 'select_word', 'select_paragraph'})
+
+# Mouse-only actions chained without per-step waits
+_CHAIN_ACTION_TYPES = frozenset({'click_area', 'double_click', 'triple_click', 'select_word', 'select_paragraph'})
+
+# Actions preceded by an occasional natural hesitation
+_HESITATION_ACTION_TYPES = frozenset({'click_area', 'type_text', 'double_click', 'triple_click'})
+
+# Action type -> handler(controller, compiled_action)
+_ACTION_HANDLERS = {
+    "click_area": lambda c, a: c.click_in_area(a['area_config'], a['area_display'], "single"),
+    "double_click": lambda c, a: c.click_in_area(a['area_config'], a['area_display'], "double"),
+    "triple_click": lambda c, a: c.click_in_area(a['area_config'], a['area_display'], "triple"),
+    "select_all": lambda c, a: c.select_all_text(),
+    "clear_field": lambda c, a: c.clear_field(),
+    "copy_text": lambda c, a: c.copy_text(),
+    "paste_text": lambda c, a: c.paste_text(),
+    "select_word": lambda c, a: c.select_word(a['area_config'], a['area_display']),
+    "select_paragraph": lambda c, a: c.select_paragraph(a['area_config'], a['area_display']),
+    "type_text": lambda c, a: c.type_text_naturally(a['text']),
+    "press_key": lambda c, a: c.press_key(a['key']),
+    "wait": lambda c, a: c._natural_wait(a),
+    "drag_select": lambda c, a: c.mouse_drag_select(a['start_area_config'], a['end_area_config']),
+}
+
 def show_configuration():
     """Show current configuration of areas and sequences"""
     print("\n" + "="*60)
@@ -575,33 +864,33 @@ def select_sequences_interactively():
     """Interactive sequence selection"""
     available_sequences = get_available_sequences()
     
-    print("\n🎬 Select sequences to execute:")
-    print("   Enter sequence numbers separated by commas (e.g., 1,3,5)")
-    print("   Or press ENTER for default workflow (basic_search + text_selection_copy)")
-    
-    for i, seq_name in enumerate(available_sequences, 1):
-        seq_info = get_sequence_info(seq_name)
-        print(f"   {i}. {seq_name}: {seq_info['name']}")
+    lines = [
+        "\n🎬 Select sequences to execute:",
+        "   Enter sequence numbers separated by commas (e.g., 1,3,5)",
+        "   Or press ENTER for default workflow (basic_search + text_selection_copy)",
+    ]
+    lines.extend(
+        f"   {i}. {seq_name}: {ACTION_SEQUENCES[seq_name].get('name', seq_name)}"
+        for i, seq_name in enumerate(available_sequences, 1)
+    )
+    print("\n".join(lines))
     
     choice = input("\nYour choice: ").strip()
     
     if not choice:
         return ["basic_search", "text_selection_copy"]
     
-    try:
-        indices = [int(x.strip()) - 1 for x in choice.split(',')]
-        selected_sequences = [available_sequences[i] for i in indices if 0 <= i < len(available_sequences)]
-        
-        if selected_sequences:
-            print(f"✅ Selected sequences: {', '.join(selected_sequences)}")
-            return selected_sequences
-        else:
-            print("❌ Invalid selection, using default workflow")
-            return ["basic_search", "text_selection_copy"]
+    # Keep the order the user typed; skip anything that isn't a valid number
+    count = len(available_sequences)
+    indices = [int(x) - 1 for x in choice.split(',') if x.strip().isdigit()]
+    selected_sequences = [available_sequences[i] for i in indices if 0 <= i < count]
     
-    except (ValueError, IndexError):
-        print("❌ Invalid input format, using default workflow")
-        return ["basic_search", "text_selection_copy"]
+    if selected_sequences:
+        print(f"✅ Selected sequences: {', '.join(selected_sequences)}")
+        return selected_sequences
+    
+    print("❌ Invalid selection, using default workflow")
+    return ["basic_search", "text_selection_copy"]
 
 def main():
     """Main execution function"""
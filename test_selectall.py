@@ -1,12 +1,30 @@
 import time
 import platform
-import pyautogui
 
 assert platform.system() == "Darwin", "Questo script è pensato per macOS"
 
+import pyautogui
+from Quartz import (
+    CGEventCreateKeyboardEvent,
+    CGEventPost,
+    CGEventSetFlags,
+    kCGHIDEventTap,
+    kCGEventFlagMaskCommand,
+)
+
 # Piccola pausa automatica tra azioni
 pyautogui.PAUSE = 0.05
 
+# Keycode virtuale del tasto 'a' (kVK_ANSI_A)
+KEYCODE_A = 0
+
+def select_all_quartz():
+    # Cmd+A come singola coppia di eventi Quartz con il flag Command già impostato
+    for key_down in (True, False):
+        event = CGEventCreateKeyboardEvent(None, KEYCODE_A, key_down)
+        CGEventSetFlags(event, kCGEventFlagMaskCommand)
+        CGEventPost(kCGHIDEventTap, event)
+
 def select_all_keydown():
     # Sequenza esplicita con micro-delay: più affidabile di hotkey in alcuni contesti
     pyautogui.keyDown('command')
@@ -31,9 +49,10 @@ if __name__ == "__main__":
     # 2 secondi per fare click nella casella di testo
     time.sleep(2)
 
-    # Prova 1 (più affidabile)
-    select_all_keydown()
+    # Prova 1 (più veloce e affidabile: eventi nativi)
+    select_all_quartz()
 
     # Se ancora scrive solo "a", commenta la riga sopra e prova una delle seguenti:
+    # select_all_keydown()
     # select_all_left()
     # select_all_hotkey()
@@ -4,45 +4,106 @@ Contains all the basic automation actions for BookBolt operations
 """
 
 import time
-import random
 import platform
+import numpy as np
 import pyautogui
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Native input events for clicks and shortcuts; pyautogui remains the fallback
+try:
+    from pynput.mouse import Controller as PynputMouse, Button
+    from pynput.keyboard import Controller as PynputKeyboard, Key
+    PYNPUT_AVAILABLE = True
+except ImportError:
+    PYNPUT_AVAILABLE = False
+
+# Platform is fixed for the life of the process
+_IS_MACOS = platform.system() == "Darwin"
+
+# Clipboard change counter, bumped by every copy (images as well as text), so
+# copy_graphic can return as soon as the copy lands; None where unavailable
+_clipboard_change_count = None
+if _IS_MACOS:
+    try:
+        from AppKit import NSPasteboard
+        
+        def _clipboard_change_count() -> int:
+            return NSPasteboard.generalPasteboard().changeCount()
+    except ImportError:
+        pass
+elif platform.system() == "Windows":
+    import ctypes
+    
+    def _clipboard_change_count() -> int:
+        return ctypes.windll.user32.GetClipboardSequenceNumber()
 
 class AutomationActions:
     """
     Contains all basic automation actions like clicking, typing, copying, etc.
     """
     
-    def __init__(self, areas: Dict[str, Any], random_helper, user_config_manager):
+    # Uniform draws generated per refill of the click-point buffer
+    RANDOM_BUFFER_SIZE = 1024
+    
+    def __init__(self, areas: Dict[str, Any], random_helper, user_config_manager,
+                 fast_mode: Optional[bool] = None):
         self.areas = areas
         self.random_helper = random_helper
         self.user_config = user_config_manager
-        self.is_macos = platform.system() == "Darwin"
+        
+        # Fast mode teleports the cursor and skips the pre-click pause;
+        # the default eased move stays in place for bot-detection avoidance
+        if fast_mode is None:
+            fast_mode = getattr(user_config_manager, 'fast_mode', False)
+        self.fast_mode = fast_mode
+        self.is_macos = _IS_MACOS
+        self._mod_key = 'command' if _IS_MACOS else 'ctrl'
+        self._rng = np.random.default_rng()
+        self._refill_random_buffer()
+        
+        # Normalized (min_x, max_x, min_y, max_y, display name) per area
+        self._area_bounds = {}
+        for name, cfg in areas.items():
+            x1, y1, x2, y2 = cfg['coordinates']
+            self._area_bounds[name] = (min(x1, x2), max(x1, x2),
+                                       min(y1, y2), max(y1, y2),
+                                       cfg.get('name', name))
+        
+        if PYNPUT_AVAILABLE:
+            self._mouse = PynputMouse()
+            self._kb = PynputKeyboard()
+            self._native_mod_key = Key.cmd if _IS_MACOS else Key.ctrl
+        else:
+            self._mouse = None
+            self._kb = None
     
     def click_in_area(self, area_name: str) -> bool:
         """Click in a random point within the specified area."""
         try:
-            if area_name not in self.areas:
+            bounds = self._area_bounds.get(area_name)
+            if bounds is None:
                 print(f"❌ Area '{area_name}' not found")
                 return False
             
-            area_config = self.areas[area_name]
-            coords = area_config['coordinates']
-            x1, y1, x2, y2 = coords
-            
-            min_x, max_x = min(x1, x2), max(x1, x2)
-            min_y, max_y = min(y1, y2), max(y1, y2)
-            
-            click_x = random.randint(min_x, max_x)
-            click_y = random.randint(min_y, max_y)
+            min_x, max_x, min_y, max_y, area_name_display = bounds
+            u, v = self._next_uniform_pair()
+            click_x = min_x + int(u * (max_x - min_x + 1))
+            click_y = min_y + int(v * (max_y - min_y + 1))
             
-            area_name_display = area_config.get('name', area_name)
             print(f"🎯 Clicking in {area_name_display} at ({click_x}, {click_y})")
             
-            pyautogui.moveTo(click_x, click_y, duration=0.8)
-            time.sleep(0.3)
-            pyautogui.click()
+            if not self.fast_mode:
+                pyautogui.moveTo(click_x, click_y, duration=0.8, _pause=False)
+                time.sleep(0.3)
+            elif self._mouse is not None:
+                self._mouse.position = (click_x, click_y)
+            else:
+                pyautogui.moveTo(click_x, click_y, _pause=False)
+            
+            if self._mouse is not None:
+                self._mouse.click(Button.left)
+            else:
+                pyautogui.click(_pause=False)
             
             print(f"✅ Click successful")
             return True
@@ -55,15 +116,7 @@ class AutomationActions:
         """Select all text using enhanced implementation."""
         try:
             print("📋 Selecting all text...")
-            if self.is_macos:
-                print("📋 Selecting all text ON MAC")
-                pyautogui.keyDown('command')
-                time.sleep(0.06)
-                pyautogui.press('a')
-                time.sleep(0.02)
-                pyautogui.keyUp('command')
-            else:
-                pyautogui.hotkey('ctrl', 'a', interval=0.1)
+            self._hotkey('a')
             
             time.sleep(0.3)
             print("✅ Select all executed")
@@ -77,14 +130,7 @@ class AutomationActions:
         try:
             print(f"⌨️ Typing: '{text}'")
             
-            for i, char in enumerate(text):
-                pyautogui.write(char)
-                char_delay = self.random_helper.get_typing_delay(char=char)
-                time.sleep(char_delay)
-                
-                if i > 0 and i % 4 == 0 and random.random() < 0.2:
-                    brief_pause = self.random_helper.get_typing_delay() * 3
-                    time.sleep(brief_pause)
+            self._write_batched(text, pause_every=4, pause_chance=0.2, pause_factor=3)
             
             print(f"✅ Typed successfully")
             return True
@@ -101,14 +147,7 @@ class AutomationActions:
             print(f"⌨️ Typing dynamic text: '{text}'")
             print(f"📊 Notebook {self.user_config.current_notebook_number}")
             
-            for i, char in enumerate(text):
-                pyautogui.write(char)
-                char_delay = self.random_helper.get_typing_delay(char=char)
-                time.sleep(char_delay)
-                
-                if i > 0 and i % 8 == 0 and random.random() < 0.15:
-                    brief_pause = self.random_helper.get_typing_delay() * 2
-                    time.sleep(brief_pause)
+            self._write_batched(text, pause_every=8, pause_chance=0.15, pause_factor=2)
             
             print(f"✅ Dynamic text typed successfully")
             return True
@@ -117,42 +156,91 @@ class AutomationActions:
             print(f"❌ Dynamic text typing failed: {e}")
             return False
     
-    def copy_graphic(self) -> bool:
-        """Copy selected graphic element."""
+    def copy_graphic(self, poll: bool = True) -> bool:
+        """
+        Copy selected graphic element.
+        
+        Args:
+            poll: Return as soon as the clipboard change counter moves (at most 0.5s);
+                  without a counter on this platform, always sleep 0.5s
+        """
         try:
             print("🎨 Copying graphic...")
-            if self.is_macos:
-                pyautogui.keyDown('command')
-                time.sleep(0.06)
-                pyautogui.press('c')
-                time.sleep(0.02)
-                pyautogui.keyUp('command')
-            else:
-                pyautogui.hotkey('ctrl', 'c', interval=0.1)
+            counter = _clipboard_change_count if poll else None
+            before = counter() if counter is not None else None
+            self._hotkey('c')
             
-            time.sleep(0.5)
+            if before is None:
+                time.sleep(0.5)
+            else:
+                deadline = time.monotonic() + 0.5
+                while counter() == before and time.monotonic() < deadline:
+                    time.sleep(0.01)
             print("✅ Graphic copied")
             return True
         except Exception as e:
             print(f"❌ Copy failed: {e}")
             return False
     
-    def paste_graphic(self) -> bool:
-        """Paste copied graphic element."""
+    def paste_graphic(self, settle: float = 1.0) -> bool:
+        """
+        Paste copied graphic element.
+        
+        Args:
+            settle: Seconds to wait after pasting (there is no signal that the paste landed)
+        """
         try:
             print("🎨 Pasting graphic...")
-            if self.is_macos:
-                pyautogui.keyDown('command')
-                time.sleep(0.06)
-                pyautogui.press('v')
-                time.sleep(0.02)
-                pyautogui.keyUp('command')
-            else:
-                pyautogui.hotkey('ctrl', 'v', interval=0.1)
+            self._hotkey('v')
             
-            time.sleep(1.0)
+            time.sleep(settle)
             print("✅ Graphic pasted")
             return True
         except Exception as e:
             print(f"❌ Paste failed: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _hotkey(self, letter: str):
+        """Press the platform modifier (Cmd/Ctrl) + letter."""
+        if self._kb is not None:
+            with self._kb.pressed(self._native_mod_key):
+                self._kb.tap(letter)
+        else:
+            pyautogui.keyDown(self._mod_key, _pause=False)
+            pyautogui.press(letter, _pause=False)
+            pyautogui.keyUp(self._mod_key, _pause=False)
+    
+    def _refill_random_buffer(self):
+        """Pre-draw a batch of uniform [0, 1) samples for click-point sampling."""
+        self._random_buffer = self._rng.random(self.RANDOM_BUFFER_SIZE).tolist()
+        self._random_pos = 0
+    
+    def _next_uniform_pair(self):
+        """Next two samples from the buffer, refilling it when exhausted."""
+        i = self._random_pos
+        if i + 2 > self.RANDOM_BUFFER_SIZE:
+            self._refill_random_buffer()
+            i = 0
+        self._random_pos = i + 2
+        return self._random_buffer[i], self._random_buffer[i + 1]
+    
+    def _write_batched(self, text: str, pause_every: int, pause_chance: float, pause_factor: float):
+        """
+        Type text in runs of characters sharing the same delay (to the centisecond),
+        with occasional brief pauses after every pause_every-th character.
+        """
+        # Natural delay per character drawn in one batch, rounded so neighbouring keys can share a run
+        delays = np.round(self.random_helper.get_typing_delays(text), 2).tolist()
+        positions = np.arange(pause_every, len(text), pause_every)
+        pauses = set(positions[self._rng.random(len(positions)) < pause_chance].tolist())
+        
+        run_start = 0
+        for i in range(len(text)):
+            last = i + 1 == len(text)
+            if last or i in pauses or delays[i + 1] != delays[run_start]:
+                pyautogui.write(text[run_start:i + 1], interval=delays[run_start], _pause=False)
+                run_start = i + 1
+                
+                if i in pauses:
+                    brief_pause = self.random_helper.get_typing_delay() * pause_factor
+                    time.sleep(brief_pause)
@@ -4,7 +4,9 @@ Handles execution of multiple notebooks with progress tracking and summaries
 """
 
 import time
-from typing import Dict, Any, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List
 from utils.random_helper import RandomHelper
 
 class BatchProcessor:
@@ -13,9 +15,18 @@ class BatchProcessor:
     error handling, and detailed execution summaries.
     """
     
-    def __init__(self, user_config_manager, random_helper: RandomHelper):
+    _BANNER = "=" * 50
+    
+    def __init__(self, user_config_manager, random_helper: RandomHelper, max_workers: int = 1,
+                 verbose: bool = True):
         self.config = user_config_manager
         self.random_helper = random_helper
+        self.verbose = verbose
+        
+        # Notebooks run concurrently only when the executor is reentrant
+        # (e.g. one browser instance per worker); 1 keeps the serial loop
+        self.max_workers = max(1, max_workers)
+        self._counter_lock = threading.Lock()
         
         # Tracking variables
         self.successful_notebooks = 0
@@ -23,6 +34,19 @@ class BatchProcessor:
         self.execution_start_time = None
         self.execution_end_time = None
         
+        # Run constants, cached from the config when a batch starts
+        self._start_number = None
+        self._total_notebooks = None
+        self._expected_end = None
+        self._template_name = None
+    
+    def _cache_run_constants(self):
+        """Snapshot the batch range and template name from the config."""
+        self._start_number = self.config.start_number
+        self._total_notebooks = self.config.total_notebooks
+        self._expected_end = self._start_number + self._total_notebooks - 1
+        self._template_name = self.config.selected_template['name']
+        
     def execute_batch_processing(self, sequence_executor: Callable[[str], bool], 
                                 sequence_name: str = "template_creation_workflow") -> bool:
         """
@@ -36,22 +60,32 @@ class BatchProcessor:
             bool: True if all sequences completed successfully
         """
         try:
-            self.execution_start_time = time.time()
+            self.execution_start_time = time.monotonic()
+            self._cache_run_constants()
+            total = self._total_notebooks
+            
+            # Pauses between notebooks, drawn up front (one fewer than notebooks)
+            pauses = [self.random_helper.get_natural_pause("general") for _ in range(total - 1)]
             
-            print(f"\n🚀 Starting batch execution for {self.config.total_notebooks} notebooks")
-            print(f"📈 Range: {self.config.start_number} to {self.config.start_number + self.config.total_notebooks - 1}")
-            print(f"📚 Template: {self.config.selected_template['name']}")
+            print(f"\n🚀 Starting batch execution for {total} notebooks")
+            print(f"📈 Range: {self._start_number} to {self._expected_end}")
+            print(f"📚 Template: {self._template_name}")
             
             # Reset counters
             self.successful_notebooks = 0
             self.failed_notebooks = 0
-            self.config.current_notebook_number = self.config.start_number
+            self.config.current_notebook_number = self._start_number
+            
+            if self.max_workers > 1:
+                return self._execute_parallel(sequence_executor, sequence_name, pauses)
             
-            for i in range(self.config.total_notebooks):
-                print(f"\n" + "="*50)
-                print(f"📖 NOTEBOOK {i+1}/{self.config.total_notebooks} - Number: {self.config.current_notebook_number}")
-                print(f"📝 Dynamic Text: '{self.config.generate_dynamic_text()}'")
-                print("="*50)
+            banner = self._BANNER
+            for i in range(total):
+                if self.verbose:
+                    # Generated once here; the sequence reuses it via the config's cache
+                    dynamic_text = self.config.generate_dynamic_text()
+                    print(f"\n{banner}\n📖 NOTEBOOK {i+1}/{total} - Number: {self.config.current_notebook_number}\n"
+                          f"📝 Dynamic Text: '{dynamic_text}'\n{banner}")
                 
                 # Execute sequence for this notebook
                 success = sequence_executor(sequence_name)
@@ -74,12 +108,13 @@ class BatchProcessor:
                 self.config.current_notebook_number += 1
                 
                 # Pause between notebooks (except for the last one)
-                if i < self.config.total_notebooks - 1:
-                    pause = self.random_helper.get_natural_pause("general")
-                    print(f"⏸️ Pause between notebooks: {pause:.1f}s")
+                if i < total - 1:
+                    pause = pauses[i]
+                    if self.verbose:
+                        print(f"⏸️ Pause between notebooks: {pause:.1f}s")
                     time.sleep(pause)
             
-            self.execution_end_time = time.time()
+            self.execution_end_time = time.monotonic()
             
             # Final summary
             self.print_batch_summary()
@@ -89,8 +124,57 @@ class BatchProcessor:
             print(f"❌ Batch execution failed: {e}")
             return False
     
+    def _execute_parallel(self, sequence_executor: Callable[[str], bool], sequence_name: str,
+                          pauses: List[float]) -> bool:
+        """
+        Run all notebooks on a worker pool, each thread bound to its own notebook number.
+        
+        Failures are counted rather than prompted for, since other notebooks
+        are already in flight.
+        """
+        total = self._total_notebooks
+        jobs = [(i, self._start_number + i) for i in range(total)]
+        print(f"🧵 Running on {self.max_workers} workers")
+        
+        def run_notebook(job):
+            i, number = job
+            # Natural pause before every notebook after a worker's first one
+            if i >= self.max_workers:
+                time.sleep(pauses[i - 1])
+            
+            self.config.bind_thread_notebook_number(number)
+            try:
+                if self.verbose:
+                    print(f"📖 NOTEBOOK {i+1}/{total} - Number: {number} - '{self.config.generate_dynamic_text()}'")
+                try:
+                    success = sequence_executor(sequence_name)
+                except Exception as e:
+                    print(f"❌ Notebook {number} raised: {e}")
+                    success = False
+            finally:
+                self.config.bind_thread_notebook_number(None)
+            
+            with self._counter_lock:
+                if success:
+                    self.successful_notebooks += 1
+                else:
+                    self.failed_notebooks += 1
+            print(f"{'✅' if success else '❌'} Notebook {number} {'completed successfully!' if success else 'failed!'}")
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(run_notebook, jobs))
+        
+        self.config.current_notebook_number = self._start_number + total
+        self.execution_end_time = time.monotonic()
+        
+        self.print_batch_summary()
+        return self.failed_notebooks == 0
+    
     def print_batch_summary(self):
         """Print detailed batch execution summary with start/end numbers."""
+        if self._expected_end is None:
+            self._cache_run_constants()
+        
         execution_time = None
         if self.execution_start_time and self.execution_end_time:
             execution_time = self.execution_end_time - self.execution_start_time
@@ -98,14 +182,14 @@ class BatchProcessor:
         print(f"\n" + "="*60)
         print(f"📊 BATCH EXECUTION SUMMARY")
         print(f"="*60)
-        print(f"📚 Template: {self.config.selected_template['name']}")
-        print(f"🔢 Configured Range: {self.config.start_number} to {self.config.start_number + self.config.total_notebooks - 1}")
-        print(f"🔢 Actual Range Processed: {self.config.start_number} to {self.config.current_notebook_number - 1}")
+        print(f"📚 Template: {self._template_name}")
+        print(f"🔢 Configured Range: {self._start_number} to {self._expected_end}")
+        print(f"🔢 Actual Range Processed: {self._start_number} to {self.config.current_notebook_number - 1}")
         print(f"✅ Successful: {self.successful_notebooks}")
         print(f"❌ Failed: {self.failed_notebooks}")
         
-        if self.config.total_notebooks > 0:
-            success_rate = (self.successful_notebooks / self.config.total_notebooks) * 100
+        if self._total_notebooks > 0:
+            success_rate = (self.successful_notebooks / self._total_notebooks) * 100
             print(f"📈 Success Rate: {success_rate:.1f}%")
         
         if execution_time:
@@ -115,7 +199,7 @@ class BatchProcessor:
                 print(f"⏱️ Average Time per Notebook: {avg_time:.1f} seconds")
         
         # Show where we stopped if interrupted
-        expected_end = self.config.start_number + self.config.total_notebooks - 1
+        expected_end = self._expected_end
         actual_end = self.config.current_notebook_number - 1
         
         if actual_end < expected_end:
@@ -128,6 +212,9 @@ class BatchProcessor:
     
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics as dictionary"""
+        if self._expected_end is None:
+            self._cache_run_constants()
+        
         execution_time = None
         if self.execution_start_time and self.execution_end_time:
             execution_time = self.execution_end_time - self.execution_start_time
@@ -135,11 +222,11 @@ class BatchProcessor:
         return {
             'successful_notebooks': self.successful_notebooks,
             'failed_notebooks': self.failed_notebooks,
-            'total_configured': self.config.total_notebooks,
-            'start_number': self.config.start_number,
-            'end_number_configured': self.config.start_number + self.config.total_notebooks - 1,
+            'total_configured': self._total_notebooks,
+            'start_number': self._start_number,
+            'end_number_configured': self._expected_end,
             'end_number_actual': self.config.current_notebook_number - 1,
-            'success_rate': (self.successful_notebooks / self.config.total_notebooks * 100) if self.config.total_notebooks > 0 else 0,
+            'success_rate': (self.successful_notebooks / self._total_notebooks * 100) if self._total_notebooks > 0 else 0,
             'execution_time_seconds': execution_time,
             'avg_time_per_notebook': execution_time / self.successful_notebooks if execution_time and self.successful_notebooks > 0 else None
         }
\ No newline at end of file
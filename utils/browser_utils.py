@@ -7,19 +7,49 @@ import time
 import subprocess
 import platform
 import os
+import hashlib
+import select
+import atexit
+import json
+import tempfile
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pyautogui
 
-def get_screen_size():
+# Hash veloce non crittografico per rilevare cambi dello schermo
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Sistema operativo letto una sola volta all'import
+_SYSTEM = platform.system()
+
+@lru_cache(maxsize=1)
+def _screen_size():
+    """Dimensioni schermo, lette una sola volta da pyautogui."""
+    width, height = pyautogui.size()
+    return width, height
+
+def get_screen_size(verbose=True):
     """
     Ottieni dimensioni dello schermo corrente.
     
+    Args:
+        verbose: Stampa le dimensioni
+        
     Returns:
         tuple: (width, height)
     """
-    width, height = pyautogui.size()
-    print(f"🖥️  Screen size: {width}x{height}")
+    width, height = _screen_size()
+    if verbose:
+        print(f"🖥️  Screen size: {width}x{height}")
     return width, height
 
+@lru_cache(maxsize=1)
 def get_chrome_path():
     """
     Trova il percorso dell'eseguibile Chrome in base al sistema operativo.
@@ -27,15 +57,13 @@ def get_chrome_path():
     Returns:
         str: Path di Chrome o None se non trovato
     """
-    system = platform.system()
-    
-    if system == "Windows":
+    if _SYSTEM == "Windows":
         possible_paths = [
             r"C:\Program Files\Google\Chrome\Application\chrome.exe",
             r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
             os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe")
         ]
-    elif system == "Darwin":  # macOS
+    elif _SYSTEM == "Darwin":  # macOS
         possible_paths = [
             "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
         ]
@@ -52,7 +80,35 @@ def get_chrome_path():
     
     return None
 
-def open_positioned_browser(url, width_fraction=2/3, height_fraction=1.0, position="left"):
+@lru_cache(maxsize=16)
+def _compute_window_geometry(width_fraction, height_fraction, position):
+    """
+    Calcola posizione e dimensioni della finestra (memorizzate per parametri).
+    
+    Returns:
+        tuple: (x, y, width, height)
+    """
+    screen_width, screen_height = _screen_size()
+    
+    # Calcola dimensioni finestra
+    window_width = int(screen_width * width_fraction)
+    window_height = int(screen_height * height_fraction)
+    
+    # Calcola posizione finestra
+    if position == "left":
+        window_x = 0
+    elif position == "right":
+        window_x = screen_width - window_width
+    elif position == "center":
+        window_x = (screen_width - window_width) // 2
+    else:
+        window_x = 0  # Default left
+    
+    window_y = 0  # Sempre top dello schermo
+    return window_x, window_y, window_width, window_height
+
+def open_positioned_browser(url, width_fraction=2/3, height_fraction=1.0, position="left",
+                            debugging_port=None, user_data_dir=None):
     """
     Apre browser Chrome posizionato e dimensionato.
     
@@ -61,6 +117,10 @@ def open_positioned_browser(url, width_fraction=2/3, height_fraction=1.0, positi
         width_fraction: Frazione larghezza schermo (0.0-1.0)
         height_fraction: Frazione altezza schermo (0.0-1.0)  
         position: Posizione ("left", "right", "center")
+        debugging_port: Se impostato, abilita il DevTools Protocol su questa porta
+                        così le pagine successive si aprono come tab (open_positioned_tab)
+        user_data_dir: Profilo Chrome da usare con debugging_port
+                       (default: profilo dedicato nella cartella temporanea)
         
     Returns:
         subprocess.Popen: Processo browser o None se errore
@@ -71,24 +131,9 @@ def open_positioned_browser(url, width_fraction=2/3, height_fraction=1.0, positi
             print("❌ Chrome not found on system")
             return None
         
-        # Ottieni dimensioni schermo
-        screen_width, screen_height = get_screen_size()
-        
-        # Calcola dimensioni finestra
-        window_width = int(screen_width * width_fraction)
-        window_height = int(screen_height * height_fraction)
-        
-        # Calcola posizione finestra
-        if position == "left":
-            window_x = 0
-        elif position == "right":
-            window_x = screen_width - window_width
-        elif position == "center":
-            window_x = (screen_width - window_width) // 2
-        else:
-            window_x = 0  # Default left
-        
-        window_y = 0  # Sempre top dello schermo
+        window_x, window_y, window_width, window_height = _compute_window_geometry(
+            width_fraction, height_fraction, position
+        )
         
         print(f"🌐 Opening Chrome browser:")
         print(f"   • URL: {url}")
@@ -105,22 +150,33 @@ def open_positioned_browser(url, width_fraction=2/3, height_fraction=1.0, positi
             "--no-default-browser-check",
             "--disable-default-apps",
             "--force-device-scale-factor=1.0",  # Forza scala 1:1
-            url
         ]
+        if debugging_port:
+            # Chrome richiede un profilo non di default per il debugging remoto
+            browser_args += [
+                f"--remote-debugging-port={debugging_port}",
+                f"--user-data-dir={user_data_dir or os.path.join(tempfile.gettempdir(), 'kdp_chrome_profile')}",
+            ]
+        browser_args.append(url)
         
         # Avvia processo browser
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             browser_process = subprocess.Popen(
                 browser_args,
                 creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
             )
         else:
-            browser_process = subprocess.Popen(browser_args)
+            try:
+                # close_fds=False senza preexec_fn: CPython può usare posix_spawn/vfork
+                # invece di fork+exec; i fd di Python sono già non ereditabili (PEP 446)
+                browser_process = subprocess.Popen(browser_args, close_fds=False)
+            except (OSError, ValueError):
+                browser_process = subprocess.Popen(browser_args)
         
         print("✅ Chrome browser process started")
         
-        # Aspetta che Chrome si avvii
-        time.sleep(3)
+        # Aspetta che la finestra di Chrome compaia (invece di 3s fissi)
+        _wait_for_chrome_window()
         
         # Forza il posizionamento usando AppleScript (macOS) o altri metodi
         force_window_position(window_x, window_y, window_width, window_height)
@@ -131,6 +187,233 @@ def open_positioned_browser(url, width_fraction=2/3, height_fraction=1.0, positi
         print(f"❌ Failed to open Chrome browser: {e}")
         return None
 
+class _OsascriptWorker:
+    """
+    Interprete AppleScript persistente (`osascript -i`): evita fork+exec e
+    avvio dell'interprete per ogni script.
+    """
+    
+    SENTINEL = "__kdp_osascript_done__"
+    
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ['osascript', '-i'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+    
+    def is_alive(self):
+        return self.process.poll() is None
+    
+    def run(self, statements, timeout=2.0):
+        """
+        Esegue istruzioni AppleScript (una per riga) e aspetta che siano completate.
+        
+        Args:
+            statements: Lista di istruzioni su singola riga
+            timeout: Secondi massimi di attesa
+            
+        Returns:
+            bool: True se l'interprete ha confermato l'esecuzione
+        """
+        # Il sentinel viene valutato dopo gli script e stampato come risultato
+        payload = "\n".join(list(statements) + [f'"{self.SENTINEL}"']) + "\n"
+        self.process.stdin.write(payload.encode('utf-8'))
+        self.process.stdin.flush()
+        
+        fd = self.process.stdout.fileno()
+        sentinel = self.SENTINEL.encode('utf-8')
+        deadline = time.monotonic() + timeout
+        output = b""
+        while sentinel not in output:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return False
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return False
+            output += chunk
+        return True
+    
+    def close(self):
+        if self.is_alive():
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=1)
+            except Exception:
+                self.process.kill()
+
+# Worker condiviso, creato alla prima richiesta
+_osascript_worker = None
+
+def _close_osascript_worker():
+    global _osascript_worker
+    if _osascript_worker is not None:
+        _osascript_worker.close()
+        _osascript_worker = None
+
+atexit.register(_close_osascript_worker)
+
+def run_applescript(statements, timeout=2.0, fallback_args=None):
+    """
+    Esegue istruzioni AppleScript sul worker persistente, con fallback a
+    un processo osascript one-shot se il worker non risponde.
+    
+    Args:
+        statements: Lista di istruzioni AppleScript su singola riga
+        timeout: Secondi massimi di attesa del worker
+        fallback_args: Argomenti di osascript per il fallback
+                       (default: le stesse istruzioni via -e)
+    """
+    global _osascript_worker
+    try:
+        if _osascript_worker is None or not _osascript_worker.is_alive():
+            _osascript_worker = _OsascriptWorker()
+        if _osascript_worker.run(statements, timeout):
+            return
+    except OSError:
+        pass
+    
+    # Worker bloccato o non disponibile: si scarta e si usa osascript -e
+    _close_osascript_worker()
+    args = ['osascript']
+    if fallback_args:
+        args += fallback_args
+    else:
+        for statement in statements:
+            args += ['-e', statement]
+    subprocess.run(args, capture_output=True)
+
+# Script di posizionamento parametrico, compilato una volta con osacompile
+_POSITION_SCRIPT = """on run argv
+    set x1 to (item 1 of argv) as integer
+    set y1 to (item 2 of argv) as integer
+    set x2 to (item 3 of argv) as integer
+    set y2 to (item 4 of argv) as integer
+    tell application "Google Chrome"
+        activate
+        set bounds of front window to {x1, y1, x2, y2}
+    end tell
+end run
+"""
+
+@lru_cache(maxsize=1)
+def _compiled_position_script():
+    """
+    Compila _POSITION_SCRIPT in un .scpt nella cartella temporanea.
+    
+    Returns:
+        str: Path dello script compilato o None se osacompile fallisce
+    """
+    path = os.path.join(tempfile.gettempdir(), "kdp_window_position.scpt")
+    try:
+        result = subprocess.run(['osacompile', '-o', path, '-e', _POSITION_SCRIPT], capture_output=True)
+        return path if result.returncode == 0 else None
+    except OSError:
+        return None
+
+def _chrome_window_exists():
+    """
+    Controlla se esiste una finestra di Chrome.
+    
+    Returns:
+        bool: True/False, oppure None se il controllo non è disponibile
+    """
+    try:
+        if _SYSTEM == "Darwin":
+            result = subprocess.run(
+                ['osascript', '-e', 'tell application "System Events" to exists (window 1 of process "Google Chrome")'],
+                capture_output=True, text=True, timeout=2
+            )
+            return result.stdout.strip() == "true"
+        elif _SYSTEM == "Windows":
+            import ctypes
+            # Classe delle finestre top-level di Chrome
+            return bool(ctypes.windll.user32.FindWindowW("Chrome_WidgetWin_1", None))
+        else:
+            result = subprocess.run(
+                ['xdotool', 'search', '--onlyvisible', '--class', 'chrome'],
+                capture_output=True, timeout=2
+            )
+            return result.returncode == 0
+    except (OSError, AttributeError, subprocess.TimeoutExpired):
+        return None
+
+def _wait_for_chrome_window(timeout=10, poll_interval=0.05):
+    """
+    Aspetta che compaia la finestra di Chrome, con fallback all'attesa fissa di 3s.
+    
+    Args:
+        timeout: Secondi massimi di attesa
+        poll_interval: Secondi tra un controllo e l'altro
+        
+    Returns:
+        bool: True se la finestra è stata trovata
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    while time.monotonic() < deadline:
+        exists = _chrome_window_exists()
+        if exists is None:
+            # Nessun modo di controllare su questo sistema
+            time.sleep(3)
+            return False
+        if exists:
+            print(f"✅ Chrome window detected after {time.monotonic() - start:.1f}s")
+            return True
+        time.sleep(poll_interval)
+    
+    print(f"⚠️  Chrome window not detected within {timeout}s")
+    return False
+
+def _devtools_request(port, path, method="GET", timeout=2.0):
+    """Chiamata all'endpoint HTTP del DevTools Protocol di Chrome."""
+    request = urllib.request.Request(f"http://127.0.0.1:{port}{path}", method=method)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read().decode('utf-8')
+
+def open_positioned_tab(url, debugging_port=9222):
+    """
+    Apre un URL in una nuova tab del Chrome già avviato con debugging_port,
+    invece di lanciare un nuovo processo.
+    
+    Args:
+        url: URL da aprire
+        debugging_port: Porta DevTools passata a open_positioned_browser
+        
+    Returns:
+        str: Id della tab (per close_tab) o None se errore
+    """
+    try:
+        target = json.loads(_devtools_request(debugging_port, "/json/new?" + urllib.parse.quote(url, safe=''), method="PUT"))
+        print(f"🗂️  Opened tab: {url}")
+        return target['id']
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Failed to open tab: {e}")
+        return None
+
+def close_tab(tab_id, debugging_port=9222):
+    """
+    Chiude una tab aperta con open_positioned_tab.
+    
+    Args:
+        tab_id: Id restituito da open_positioned_tab
+        debugging_port: Porta DevTools del browser
+        
+    Returns:
+        bool: True se chiusura riuscita
+    """
+    try:
+        _devtools_request(debugging_port, f"/json/close/{tab_id}")
+        return True
+    except OSError as e:
+        print(f"⚠️  Could not close tab {tab_id}: {e}")
+        return False
+
 def force_window_position(x, y, width, height):
     """
     Forza il posizionamento della finestra Chrome usando metodi OS-specifici.
@@ -140,22 +423,26 @@ def force_window_position(x, y, width, height):
         width, height: Dimensioni target
     """
     try:
-        system = platform.system()
-        
-        if system == "Darwin":  # macOS
-            # Usa AppleScript per forzare posizionamento
-            applescript = f'''
-            tell application "Google Chrome"
-                activate
-                set bounds of front window to {{{x}, {y}, {x + width}, {y + height}}}
-            end tell
-            '''
+        if _SYSTEM == "Darwin":  # macOS
+            # Usa AppleScript per forzare posizionamento (istruzioni su singola riga per osascript -i)
+            bounds = [x, y, x + width, y + height]
+            script_path = _compiled_position_script()
+            if script_path:
+                # Script già compilato: nessun parsing, solo i parametri
+                statements = [f'run script (POSIX file "{script_path}") with parameters {{{", ".join(map(str, bounds))}}}']
+                fallback_args = [script_path] + [str(v) for v in bounds]
+            else:
+                statements = [
+                    'tell application "Google Chrome" to activate',
+                    f'tell application "Google Chrome" to set bounds of front window to {{{", ".join(map(str, bounds))}}}'
+                ]
+                fallback_args = None
             
             print(f"🔧 Forcing window position with AppleScript...")
-            subprocess.run(['osascript', '-e', applescript], capture_output=True)
+            run_applescript(statements, fallback_args=fallback_args)
             print(f"✅ Window forced to position ({x}, {y}) size {width}x{height}")
             
-        elif system == "Windows":
+        elif _SYSTEM == "Windows":
             # Per Windows, potresti usare pywin32 se disponibile
             print(f"⚠️  Windows window positioning not implemented yet")
             print(f"   Manual positioning may be needed")
@@ -169,24 +456,142 @@ def force_window_position(x, y, width, height):
         print(f"⚠️  Could not force window position: {e}")
         print(f"   Browser opened but position may not be exact")
 
-def wait_for_page_load(seconds=5, show_progress=True):
+def wait_for_page_load(seconds=5, show_progress=True, readiness_fn=None, poll_interval=0.1, verbose=True):
     """
-    Aspetta che la pagina si carichi.
+    Aspetta che la pagina si carichi, uscendo appena readiness_fn la segnala pronta.
     
     Args:
-        seconds: Secondi da aspettare
+        seconds: Attesa massima in secondi
         show_progress: Mostra countdown progressivo
+        readiness_fn: Callable senza argomenti che ritorna True a pagina pronta
+                      (None = attesa fissa di `seconds`)
+        poll_interval: Secondi tra un controllo e l'altro
+        verbose: Stampa messaggi di inizio/fine attesa
+        
+    Returns:
+        bool: False se readiness_fn non ha mai segnalato la pagina pronta
     """
-    if show_progress:
-        print(f"⏳ Waiting {seconds} seconds for page load...")
-        for i in range(seconds, 0, -1):
-            print(f"   ⏱️  {i} seconds remaining...", end='\r')
-            time.sleep(1)
+    if verbose:
+        print(f"⏳ Waiting up to {seconds} seconds for page load...")
+    start = time.monotonic()
+    deadline = start + seconds
+    last_sec = None
+    probe_failed = False
+    
+    while True:
+        now = time.monotonic()
+        if readiness_fn is not None:
+            try:
+                if readiness_fn():
+                    if verbose:
+                        print(f"   ✅ Page ready after {now - start:.1f}s                ")
+                    return True
+            except Exception:
+                # Probe non utilizzabile (es. niente screenshot): attesa fissa fino alla scadenza
+                readiness_fn = None
+                probe_failed = True
+        
+        remaining = deadline - now
+        if remaining <= 0:
+            break
+        
+        # Countdown stampato al massimo una volta al secondo
+        if show_progress and int(remaining) != last_sec:
+            last_sec = int(remaining)
+            print(f"   ⏱️  {last_sec + 1} seconds remaining...", end='\r')
+        
+        time.sleep(min(poll_interval if readiness_fn is not None else 1.0, remaining))
+    
+    if verbose:
         print("   ✅ Page load wait completed!     ")
-    else:
-        print(f"⏳ Waiting {seconds} seconds for page load...")
-        time.sleep(seconds)
-        print("✅ Page load wait completed!")
+    return readiness_fn is None and not probe_failed
+
+def _frame_hash(image):
+    """Hash di uno screenshot per rilevare cambi (xxh3 se disponibile, altrimenti BLAKE2b a 8 byte)"""
+    data = image.tobytes()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(data)
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+def screen_settled_probe(stable_polls=4, min_wait=1.0, region=None, require_change=False):
+    """
+    Crea una readiness_fn che segnala pagina pronta quando lo schermo smette di cambiare.
+    
+    Args:
+        stable_polls: Controlli consecutivi con schermo identico richiesti
+        min_wait: Secondi minimi prima di poter segnalare pronto
+        region: (x, y, width, height) da osservare, None = schermo intero
+        require_change: Segnala pronto solo dopo aver visto almeno un cambio dello
+                        schermo (una finestra rimasta bianca non conta come caricata)
+        
+    Returns:
+        Callable[[], bool]: Probe da passare a wait_for_page_load
+    """
+    start = time.monotonic()
+    state = {'digest': None, 'stable': 0, 'changed': not require_change}
+    
+    def probe():
+        digest = _frame_hash(pyautogui.screenshot(region=region))
+        if digest == state['digest']:
+            state['stable'] += 1
+        else:
+            if state['digest'] is not None:
+                state['changed'] = True
+            state['stable'] = 0
+        state['digest'] = digest
+        return (state['changed'] and state['stable'] >= stable_polls
+                and time.monotonic() - start >= min_wait)
+    
+    return probe
+
+def page_loaded_probe(min_wait=3.0, region=None):
+    """
+    Readiness_fn per una pagina appena aperta: lo schermo deve cambiare
+    (il contenuto viene disegnato) e poi restare stabile.
+    
+    Args:
+        min_wait: Secondi minimi prima di poter segnalare pronto
+        region: (x, y, width, height) da osservare, None = schermo intero
+        
+    Returns:
+        Callable[[], bool]: Probe da passare a wait_for_page_load
+    """
+    return screen_settled_probe(stable_polls=4, min_wait=min_wait, region=region,
+                                require_change=True)
+
+def wait_for_screen_settle(region=None, timeout=1.5, interval=0.05, stable_polls=1, min_wait=0.0):
+    """
+    Aspetta in silenzio che lo schermo (o una sua regione) smetta di cambiare.
+    
+    Args:
+        region: (x, y, width, height) da osservare, None = schermo intero
+        timeout: Attesa massima in secondi
+        interval: Secondi tra uno screenshot e l'altro
+        stable_polls: Controlli consecutivi con schermo identico richiesti
+        min_wait: Secondi minimi prima di poter segnalare stabile
+        
+    Returns:
+        bool: True se lo schermo si è stabilizzato prima del timeout
+    """
+    return wait_for_page_load(timeout, show_progress=False,
+                              readiness_fn=screen_settled_probe(stable_polls, min_wait, region),
+                              poll_interval=interval, verbose=False)
+
+# Thread dedicato alle chiusure in background del browser
+_close_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-close")
+
+def close_browser_process_async(browser_process, timeout=5):
+    """
+    Chiude processo browser in background, senza bloccare il chiamante.
+    
+    Args:
+        browser_process: Processo da subprocess.Popen
+        timeout: Secondi da aspettare prima di forzare chiusura
+        
+    Returns:
+        Future: Risolve al risultato di close_browser_process (.result() per attendere)
+    """
+    return _close_executor.submit(close_browser_process, browser_process, timeout)
 
 def close_browser_process(browser_process, timeout=5):
     """
@@ -225,25 +630,66 @@ def close_browser_process(browser_process, timeout=5):
         print(f"❌ Error closing browser: {e}")
         return False
 
-def get_screen_center():
+@lru_cache(maxsize=1)
+def _screen_center():
+    """Centro schermo calcolato una sola volta."""
+    width, height = _screen_size()
+    return width // 2, height // 2
+
+def get_screen_center(verbose=True):
     """
     Calcola le coordinate del centro dello schermo.
     
+    Args:
+        verbose: Stampa le coordinate
+        
     Returns:
         tuple: (center_x, center_y)
     """
-    width, height = get_screen_size()
-    center_x = width // 2
-    center_y = height // 2
-    print(f"🎯 Screen center: ({center_x}, {center_y})")
+    center_x, center_y = _screen_center()
+    if verbose:
+        print(f"🎯 Screen center: ({center_x}, {center_y})")
     return center_x, center_y
 
-def setup_pyautogui_safety():
+# Hint di scheduling applicati una sola volta per processo
+_timing_hints_applied = False
+
+def apply_timing_hints():
+    """
+    Rende più precisi gli sleep brevi (ritardi tra tasti/click). Solo su richiesta.
+    
+    Su Windows porta il timer di sistema a 1ms (timeBeginPeriod), ripristinato
+    all'uscita: gli sleep di pochi ms non vengono più arrotondati al tick da
+    ~15ms, a costo di un consumo di batteria un po' più alto finché il processo
+    è attivo. Sugli altri sistemi non fa nulla.
+    """
+    global _timing_hints_applied
+    if _timing_hints_applied or _SYSTEM != "Windows":
+        return
+    _timing_hints_applied = True
+    
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        if winmm.timeBeginPeriod(1) == 0:
+            atexit.register(winmm.timeEndPeriod, 1)
+            print("⏱️  System timer resolution set to 1ms")
+    except (OSError, AttributeError):
+        pass
+
+def setup_pyautogui_safety(high_res_timer=False):
     """
     Configura pyautogui con impostazioni di sicurezza standard.
+    
+    Args:
+        high_res_timer: Applica anche apply_timing_hints() (timer di sistema a 1ms su Windows)
     """
     pyautogui.FAILSAFE = True   # Mouse in angolo (0,0) per stop emergenza
-    pyautogui.PAUSE = 0.1       # Pausa tra comandi pyautogui
+    pyautogui.PAUSE = 0.0       # Nessuna pausa implicita: i tempi sono gestiti dai chiamanti
+    pyautogui.MINIMUM_DURATION = 0.0
+    pyautogui.MINIMUM_SLEEP = 0.0
+    if high_res_timer:
+        apply_timing_hints()
     print("✅ PyAutoGUI safety settings configured")
 
 def move_mouse_to_center():
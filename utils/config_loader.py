@@ -5,9 +5,188 @@ Handles loading and validation of JSON configuration files
 
 import json
 import os
+import sys
+import mmap
+import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Faster JSON parsing when orjson is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Binary on-disk cache of validated configs for faster cold starts
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Schema validators compiled to Python code once at import
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+# Validation constants shared by the schemas and the fallback validators
+# Ordered so each action type has a stable integer code in action plans
+ACTION_TYPES = (
+    'click_area', 'type_text', 'type_dynamic_text', 'select_all',
+    'copy_graphic', 'paste_graphic', 'press_key', 'wait'
+)
+_VALID_ACTION_TYPES = frozenset(ACTION_TYPES)
+_ACTION_TYPE_IDX = {action_type: i for i, action_type in enumerate(ACTION_TYPES)}
+# The single argument each action type carries, if any
+_ACTION_PAYLOAD_FIELDS = {'click_area': 'area', 'type_text': 'text', 'press_key': 'key', 'wait': 'seconds'}
+_AREA_REQUIRED_FIELDS = ('name', 'coordinates', 'description')
+_SEQUENCE_REQUIRED_FIELDS = ('name', 'description', 'actions')
+_ACTION_REQUIRED_FIELDS = ('type',)
+# Extra field each action type requires
+_ACTION_TYPE_REQUIRED_FIELDS = {'click_area': 'area', 'type_text': 'text', 'press_key': 'key'}
+
+AREAS_SCHEMA = {
+    "type": "object",
+    "required": ["areas"],
+    "properties": {
+        "areas": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "required": list(_AREA_REQUIRED_FIELDS),
+                "properties": {
+                    "coordinates": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "minItems": 4,
+                        "maxItems": 4
+                    }
+                }
+            }
+        }
+    }
+}
+
+SEQUENCES_SCHEMA = {
+    "type": "object",
+    "required": ["sequences"],
+    "properties": {
+        "sequences": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "required": list(_SEQUENCE_REQUIRED_FIELDS),
+                "properties": {
+                    "actions": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": list(_ACTION_REQUIRED_FIELDS),
+                            "properties": {
+                                "type": {"enum": sorted(_VALID_ACTION_TYPES)}
+                            },
+                            "allOf": [
+                                {"if": {"required": ["type"], "properties": {"type": {"const": action_type}}}, "then": {"required": [field]}}
+                                for action_type, field in _ACTION_TYPE_REQUIRED_FIELDS.items()
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+def _compile_missing_field_check(func_name: str, fields: Tuple[str, ...]):
+    """
+    Generate a straight-line function returning the first of fields missing from a dict, or None.
+    Specializes the fallback validators to the known field lists, as fastjsonschema does for schemas.
+    """
+    lines = [f"def {func_name}(d):"]
+    lines.extend(f"    if {field!r} not in d: return {field!r}" for field in fields)
+    lines.append("    return None")
+    namespace = {}
+    exec(compile("\n".join(lines), f"<{func_name}>", "exec"), namespace)
+    return namespace[func_name]
+
+_missing_area_field = _compile_missing_field_check('_missing_area_field', _AREA_REQUIRED_FIELDS)
+_missing_sequence_field = _compile_missing_field_check('_missing_sequence_field', _SEQUENCE_REQUIRED_FIELDS)
+_missing_action_field = _compile_missing_field_check('_missing_action_field', _ACTION_REQUIRED_FIELDS)
+
+if FASTJSONSCHEMA_AVAILABLE:
+    _validate_areas_schema = fastjsonschema.compile(AREAS_SCHEMA)
+    _validate_sequences_schema = fastjsonschema.compile(SEQUENCES_SCHEMA)
+
+# Strings up to this length are interned after a stdlib json parse
+_INTERN_MAX_LEN = 40
+
+def _intern_tree(obj: Any) -> Any:
+    """Intern dict keys and short string values so repeated names share one object"""
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_tree(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_tree(item) for item in obj]
+    if isinstance(obj, str) and len(obj) < _INTERN_MAX_LEN:
+        return sys.intern(obj)
+    return obj
+
+# Files larger than this are memory-mapped instead of read into a buffer
+_MMAP_THRESHOLD = 64 * 1024
+
+@lru_cache(maxsize=32)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a JSON file once per (path, mtime, size), shared across ConfigLoader instances.
+    The returned dict is shared: callers must not mutate it.
+    """
+    data = _read_and_parse(path_str, size)
+    # orjson already de-duplicates keys while parsing; the stdlib parser does not
+    return data if ORJSON_AVAILABLE else _intern_tree(data)
+
+def _read_and_parse(path_str: str, size: int) -> Dict[str, Any]:
+    """Read and parse a JSON file, memory-mapping it when large"""
+    with open(path_str, 'rb') as f:
+        if size <= _MMAP_THRESHOLD:
+            return _loads(f.read())
+        
+        # Large files: parse straight from the mapped pages (orjson reads a memoryview in place)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if ORJSON_AVAILABLE:
+                with memoryview(mm) as view:
+                    return _loads(view)
+            return _loads(bytes(mm))
+
+# Validated + indexed results per (path, mtime_ns, size, kind), so an unchanged
+# file is parsed, validated and indexed once per process
+_prepared_cache: Dict[Tuple[str, int, int, str], Tuple[Any, ...]] = {}
+_PREPARED_CACHE_SIZE = 32
+
+# File versions (path, mtime_ns, size, kind) that already passed validation;
+# outlives _prepared_cache evictions so a re-parse of the same bytes skips validation
+_validated_keys: set = set()
+
+def _with_tuple_coordinates(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an areas configuration with list coordinates turned into tuples, leaving the input untouched"""
+    areas = config.get('areas')
+    if not isinstance(areas, dict):
+        return config
+    return {**config, 'areas': {
+        name: {**area, 'coordinates': tuple(area['coordinates'])}
+        if isinstance(area, dict) and isinstance(area.get('coordinates'), list) else area
+        for name, area in areas.items()
+    }}
 
 class ConfigurationError(Exception):
     """Custom exception for configuration-related errors"""
@@ -19,23 +198,62 @@ class ConfigLoader:
     Provides centralized configuration management with validation.
     """
     
-    def __init__(self, config_dir: str = "config"):
+    # Shared loaders per absolute config directory, see get()
+    _instances: Dict[str, 'ConfigLoader'] = {}
+    
+    def __init__(self, config_dir: str = "config", use_disk_cache: bool = True):
         """
         Initialize config loader.
         
         Args:
             config_dir: Directory containing configuration files
+            use_disk_cache: Keep validated areas/sequences in `.<file>.msgpack`
+                            shadow files so later processes skip parsing and validation
         """
         self.config_dir = Path(config_dir)
+        # Plain string form for the hot path, avoiding Path object construction per load
+        self._config_dir_str = os.path.abspath(config_dir)
+        self.use_disk_cache = use_disk_cache and MSGPACK_AVAILABLE
         self.areas_cache = None
         self.sequences_cache = None
         self.settings_cache = None
         
+        # Flat lookup indexes, built when areas/sequences are loaded
+        self._areas_by_name = None
+        self._areas_by_category = None
+        self._sequences_by_name = None
+        self._sequences_by_category = None
+        
+        # Per-sequence (type codes, payloads) parallel lists for playback
+        self._action_plans = None
+        
+        # Area coordinates as an (N, 4) array parallel to area_names, for hit-testing
+        self.area_coords = None
+        self.area_names = None
+        
         # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(self._config_dir_str):
+            self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        print(f"🔧 ConfigLoader initialized")
-        print(f"📁 Config directory: {self.config_dir.absolute()}")
+        log.debug("🔧 ConfigLoader initialized")
+        log.debug("📁 Config directory: %s", self.config_dir.absolute())
+    
+    @classmethod
+    def get(cls, config_dir: str = "config") -> 'ConfigLoader':
+        """
+        Get the shared loader for a config directory, creating it on first use.
+        
+        Args:
+            config_dir: Directory containing configuration files
+            
+        Returns:
+            ConfigLoader instance shared by all callers using the same directory
+        """
+        key = os.path.abspath(config_dir)
+        loader = cls._instances.get(key)
+        if loader is None:
+            loader = cls._instances[key] = cls(config_dir)
+        return loader
     
     def load_areas(self, filename: str = "bookbolt_areas.json", use_cache: bool = True) -> Dict[str, Any]:
         """
@@ -54,19 +272,17 @@ class ConfigLoader:
         if use_cache and self.areas_cache is not None:
             return self.areas_cache
         
-        print(f"📍 Loading click areas from {filename}")
-        
-        config = self._load_json_file(filename)
+        log.debug("📍 Loading click areas from %s", filename)
         
-        # Validate areas configuration
-        if not self.validate_areas_config(config):
-            raise ConfigurationError(f"Invalid areas configuration in {filename}")
+        # Validation and indexing happen in a single pass over the areas
+        config, prepared = self._load_prepared(filename, 'areas', self._validate_and_index_areas,
+                                               own_copy=_with_tuple_coordinates)
         
         # Cache the configuration
         self.areas_cache = config
+        self._areas_by_name, self._areas_by_category, self.area_names, self.area_coords = prepared
         
-        areas_count = len(config.get('areas', {}))
-        print(f"✅ Loaded {areas_count} click areas successfully")
+        log.debug("✅ Loaded %s click areas successfully", len(config.get('areas', {})))
         
         return config
     
@@ -87,20 +303,19 @@ class ConfigLoader:
         if use_cache and self.sequences_cache is not None:
             return self.sequences_cache
         
-        print(f"🎬 Loading action sequences from {filename}")
+        log.debug("🎬 Loading action sequences from %s", filename)
         
-        config = self._load_json_file(filename)
-        
-        # Validate sequences configuration
-        if not self.validate_sequences_config(config):
-            raise ConfigurationError(f"Invalid sequences configuration in {filename}")
+        # Validation and indexing happen in a single pass over the sequences
+        config, prepared = self._load_prepared(filename, 'sequences', self._validate_and_index_sequences)
         
         # Cache the configuration
         self.sequences_cache = config
+        self._sequences_by_name, self._sequences_by_category, self._action_plans = prepared
         
-        sequences_count = len(config.get('sequences', {}))
-        actions_count = sum(len(seq.get('actions', [])) for seq in config.get('sequences', {}).values())
-        print(f"✅ Loaded {sequences_count} sequences with {actions_count} total actions")
+        if log.isEnabledFor(logging.DEBUG):
+            sequences_count = len(config.get('sequences', {}))
+            actions_count = sum(len(seq.get('actions', [])) for seq in config.get('sequences', {}).values())
+            log.debug("✅ Loaded %s sequences with %s total actions", sequences_count, actions_count)
         
         return config
     
@@ -118,19 +333,34 @@ class ConfigLoader:
         if use_cache and self.settings_cache is not None:
             return self.settings_cache
         
-        print(f"⚙️ Loading settings from {filename}")
+        log.debug("⚙️ Loading settings from %s", filename)
         
         try:
             config = self._load_json_file(filename)
             self.settings_cache = config
-            print(f"✅ Settings loaded successfully")
+            log.debug("✅ Settings loaded successfully")
             return config
-        except FileNotFoundError:
+        except ConfigurationError:
+            if (self.config_dir / filename).exists():
+                raise
             # Return default settings if file doesn't exist
             default_settings = self._get_default_settings()
-            print(f"⚠️ Settings file not found, using defaults")
+            log.warning("⚠️ Settings file not found, using defaults")
             return default_settings
     
+    def preload_all(self) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Load areas, sequences and settings concurrently.
+        
+        Returns:
+            Tuple of (areas, sequences, settings) configurations
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            areas_future = executor.submit(self.load_areas)
+            sequences_future = executor.submit(self.load_sequences)
+            settings_future = executor.submit(self.load_settings)
+            return areas_future.result(), sequences_future.result(), settings_future.result()
+    
     def get_area_by_name(self, area_name: str) -> Optional[Dict[str, Any]]:
         """
         Get specific area configuration by name.
@@ -141,8 +371,9 @@ class ConfigLoader:
         Returns:
             Area configuration dict or None if not found
         """
-        areas_config = self.load_areas()
-        return areas_config.get('areas', {}).get(area_name)
+        if self._areas_by_name is None:
+            self.load_areas()
+        return self._areas_by_name.get(area_name)
     
     def get_sequence_by_name(self, sequence_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -154,8 +385,9 @@ class ConfigLoader:
         Returns:
             Sequence configuration dict or None if not found
         """
-        sequences_config = self.load_sequences()
-        return sequences_config.get('sequences', {}).get(sequence_name)
+        if self._sequences_by_name is None:
+            self.load_sequences()
+        return self._sequences_by_name.get(sequence_name)
     
     def list_available_areas(self) -> List[str]:
         """
@@ -164,8 +396,9 @@ class ConfigLoader:
         Returns:
             List of area names
         """
-        areas_config = self.load_areas()
-        return list(areas_config.get('areas', {}).keys())
+        if self._areas_by_name is None:
+            self.load_areas()
+        return list(self._areas_by_name)
     
     def list_available_sequences(self) -> List[str]:
         """
@@ -174,8 +407,41 @@ class ConfigLoader:
         Returns:
             List of sequence names
         """
-        sequences_config = self.load_sequences()
-        return list(sequences_config.get('sequences', {}).keys())
+        if self._sequences_by_name is None:
+            self.load_sequences()
+        return list(self._sequences_by_name)
+    
+    def get_action_plan(self, sequence_name: str) -> Optional[Tuple[List[int], List[Any]]]:
+        """
+        Get a sequence's actions as parallel lists, for dispatch without per-action dict lookups.
+        
+        Args:
+            sequence_name: Name of the sequence
+            
+        Returns:
+            (type codes indexing ACTION_TYPES, payloads) or None if not found
+        """
+        if self._action_plans is None:
+            self.load_sequences()
+        return self._action_plans.get(sequence_name)
+    
+    def find_area_at(self, x: int, y: int) -> Optional[str]:
+        """
+        Find the first area containing a screen point.
+        
+        Args:
+            x, y: Screen coordinates
+            
+        Returns:
+            Area name or None if no area contains the point
+        """
+        if self.area_coords is None:
+            self.load_areas()
+        coords = self.area_coords
+        hits = (coords[:, 0] <= x) & (x <= coords[:, 2]) & (coords[:, 1] <= y) & (y <= coords[:, 3])
+        if not hits.any():
+            return None
+        return self.area_names[int(hits.argmax())]
     
     def get_areas_by_category(self, category: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -187,13 +453,9 @@ class ConfigLoader:
         Returns:
             Dict of areas in the specified category
         """
-        areas_config = self.load_areas()
-        areas = areas_config.get('areas', {})
-        
-        return {
-            name: area for name, area in areas.items()
-            if area.get('category') == category
-        }
+        if self._areas_by_category is None:
+            self.load_areas()
+        return dict(self._areas_by_category.get(category, {}))
     
     def get_sequences_by_category(self, category: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -205,13 +467,204 @@ class ConfigLoader:
         Returns:
             Dict of sequences in the specified category
         """
-        sequences_config = self.load_sequences()
-        sequences = sequences_config.get('sequences', {})
+        if self._sequences_by_category is None:
+            self.load_sequences()
+        return dict(self._sequences_by_category.get(category, {}))
+    
+    def _load_prepared(self, filename: str, kind: str, prepare,
+                       own_copy=None) -> Tuple[Dict[str, Any], Tuple[Any, ...]]:
+        """
+        Load a configuration file with its validated lookup structures.
         
-        return {
-            name: seq for name, seq in sequences.items()
-            if seq.get('category') == category
-        }
+        Args:
+            filename: Name of the file to load
+            kind: Configuration kind ('areas' or 'sequences')
+            prepare: Fused validate-and-index pass, returning None if invalid
+            own_copy: Optional function building a private, normalized copy of the
+                      parsed config before preparing it (the parse result is shared)
+            
+        Returns:
+            Tuple of (parsed config, prepared indexes)
+            
+        Raises:
+            ConfigurationError: If file not found, invalid JSON or invalid configuration
+        """
+        file_key = self._file_key(filename)
+        cache_key = file_key + (kind,)
+        
+        entry = _prepared_cache.get(cache_key)
+        if entry is None:
+            config = self._read_disk_cache(filename, file_key) if self.use_disk_cache else None
+            if config is not None:
+                # Already validated when the shadow file was written
+                if own_copy is not None:
+                    config = own_copy(config)
+                prepared = prepare(config, validate=False)
+            else:
+                config = self._parse_file(filename, file_key)
+                if own_copy is not None:
+                    config = own_copy(config)
+                prepared = prepare(config, validate=cache_key not in _validated_keys)
+                if prepared is None:
+                    raise ConfigurationError(f"Invalid {kind} configuration in {filename}")
+                if self.use_disk_cache:
+                    self._write_disk_cache(filename, file_key, config)
+            _validated_keys.add(cache_key)
+            
+            entry = (config, prepared)
+            if len(_prepared_cache) >= _PREPARED_CACHE_SIZE:
+                _prepared_cache.clear()
+            _prepared_cache[cache_key] = entry
+        
+        return entry
+    
+    def _disk_cache_path(self, filename: str) -> Path:
+        """Shadow msgpack file holding the validated contents of filename"""
+        return self.config_dir / f".{filename}.msgpack"
+    
+    def _read_disk_cache(self, filename: str, file_key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+        """Return the cached config if its recorded source mtime/size still match"""
+        try:
+            payload = msgpack.unpackb(self._disk_cache_path(filename).read_bytes(), raw=False)
+        except Exception:
+            return None
+        if payload.get('source') != [file_key[1], file_key[2]]:
+            return None
+        return payload.get('config')
+    
+    def _write_disk_cache(self, filename: str, file_key: Tuple[str, int, int], config: Dict[str, Any]):
+        """Atomically write the validated config next to its source file"""
+        cache_path = self._disk_cache_path(filename)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(msgpack.packb({'source': [file_key[1], file_key[2]], 'config': config}))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            log.debug("Could not write config cache %s: %s", cache_path, e)
+    
+    def _validate_and_index_areas(self, config: Dict[str, Any], validate: bool = True) -> Optional[Tuple[Any, ...]]:
+        """
+        Validate an areas configuration and build its indexes in the same pass.
+        
+        Args:
+            config: Areas configuration
+            validate: False to only index (config already validated)
+            
+        Returns:
+            (by_name, by_category, names, coords array) or None if invalid
+        """
+        if validate:
+            if FASTJSONSCHEMA_AVAILABLE:
+                try:
+                    _validate_areas_schema(config)
+                except fastjsonschema.JsonSchemaException as e:
+                    log.warning("❌ Areas configuration invalid: %s", e.message)
+                    return None
+            elif not self._validate_top_level(config, 'areas', "Areas"):
+                return None
+        
+        areas = config['areas']
+        by_category = {}
+        coords_list = []
+        for area_name, area_config in areas.items():
+            if validate and not self._validate_single_area(area_name, area_config, check_coordinates=False):
+                return None
+            by_category.setdefault(area_config.get('category'), {})[area_name] = area_config
+            coords_list.append(area_config['coordinates'])
+        
+        if validate:
+            coords = self._validate_area_coordinates(areas, coords_list)
+            if coords is None:
+                return None
+        else:
+            coords = np.array(coords_list, dtype=np.int32).reshape(-1, 4)
+        return areas, by_category, list(areas), coords
+    
+    def _validate_area_coordinates(self, areas: Dict[str, Any], coords_list: List[Any]) -> Optional[np.ndarray]:
+        """
+        Check all area coordinates in one vectorized pass.
+        
+        Args:
+            areas: Areas being validated, in the same order as coords_list
+            coords_list: Each area's coordinates
+            
+        Returns:
+            (N, 4) int32 array of coordinates or None if any area is invalid
+        """
+        if not coords_list:
+            return np.empty((0, 4), dtype=np.int32)
+        
+        try:
+            coords = np.asarray(coords_list)
+        except (TypeError, ValueError):
+            coords = None
+        
+        if coords is None or coords.ndim != 2 or coords.shape[1] != 4 or coords.dtype.kind not in 'iu':
+            # Slow path only to report which area is malformed
+            for area_name, area_config in areas.items():
+                if not self._validate_single_area(area_name, area_config):
+                    break
+            return None
+        
+        bad = ~((coords[:, 0] < coords[:, 2]) & (coords[:, 1] < coords[:, 3]))
+        if bad.any():
+            area_names = list(areas)
+            for i in np.flatnonzero(bad):
+                log.warning("❌ Area '%s' has invalid coordinate bounds", area_names[i])
+            return None
+        
+        return coords.astype(np.int32, copy=False)
+    
+    def _validate_and_index_sequences(self, config: Dict[str, Any], validate: bool = True) -> Optional[Tuple[Any, ...]]:
+        """
+        Validate a sequences configuration and build its indexes in the same pass.
+        
+        Args:
+            config: Sequences configuration
+            validate: False to only index (config already validated)
+            
+        Returns:
+            (by_name, by_category, action plans) or None if invalid
+        """
+        if validate:
+            if FASTJSONSCHEMA_AVAILABLE:
+                try:
+                    _validate_sequences_schema(config)
+                except fastjsonschema.JsonSchemaException as e:
+                    log.warning("❌ Sequences configuration invalid: %s", e.message)
+                    return None
+            elif not self._validate_top_level(config, 'sequences', "Sequences"):
+                return None
+        
+        sequences = config['sequences']
+        by_category = {}
+        plans = {}
+        for seq_name, seq_config in sequences.items():
+            if validate and not FASTJSONSCHEMA_AVAILABLE and not self._validate_single_sequence(seq_name, seq_config):
+                return None
+            by_category.setdefault(seq_config.get('category'), {})[seq_name] = seq_config
+            
+            # Struct-of-arrays action plan: integer type codes plus each action's payload
+            types = []
+            payloads = []
+            for action in seq_config['actions']:
+                action_type = action['type']
+                field = _ACTION_PAYLOAD_FIELDS.get(action_type)
+                types.append(_ACTION_TYPE_IDX[action_type])
+                payloads.append(action.get(field) if field else None)
+            plans[seq_name] = (types, payloads)
+        
+        return sequences, by_category, plans
+    
+    def _validate_top_level(self, config: Dict[str, Any], key: str, label: str) -> bool:
+        """Check the top-level key of a configuration holds a dictionary"""
+        if key not in config:
+            log.warning("❌ %s configuration missing '%s' key", label, key)
+            return False
+        if not isinstance(config[key], dict):
+            log.warning("❌ %s must be a dictionary", label)
+            return False
+        return True
     
     def _load_json_file(self, filename: str) -> Dict[str, Any]:
         """
@@ -221,20 +674,47 @@ class ConfigLoader:
             filename: Name of the file to load
             
         Returns:
-            Parsed JSON data
+            Parsed JSON data (shared with other loaders; do not mutate)
             
         Raises:
             ConfigurationError: If file not found or invalid JSON
         """
-        file_path = self.config_dir / filename
+        return self._load_json_entry(filename)[0]
+    
+    def _load_json_entry(self, filename: str) -> Tuple[Dict[str, Any], Tuple[str, int, int]]:
+        """Parse a configuration file, returning the data and its (path, mtime_ns, size) key"""
+        file_key = self._file_key(filename)
+        return self._parse_file(filename, file_key), file_key
+    
+    def _file_key(self, filename: str) -> Tuple[str, int, int]:
+        """
+        Identify the current version of a configuration file.
+        
+        Raises:
+            ConfigurationError: If file not found
+        """
+        file_path = os.path.join(self._config_dir_str, filename)
         
-        if not file_path.exists():
+        # One stat serves the existence check and the cache key
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             raise ConfigurationError(f"Configuration file not found: {file_path}")
+        except OSError as e:
+            raise ConfigurationError(f"Error reading {filename}: {e}")
+        return file_path, st.st_mtime_ns, st.st_size
+    
+    def _parse_file(self, filename: str, file_key: Tuple[str, int, int]) -> Dict[str, Any]:
+        """
+        Parse a configuration file version, served from the process-wide parse cache.
         
+        Raises:
+            ConfigurationError: If invalid JSON or unreadable
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return _parse_cached(*file_key)
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
             raise ConfigurationError(f"Invalid JSON in {filename}: {e}")
         except Exception as e:
             raise ConfigurationError(f"Error reading {filename}: {e}")
@@ -250,25 +730,9 @@ class ConfigLoader:
             True if configuration is valid
         """
         try:
-            # Check required top-level keys
-            if 'areas' not in config:
-                print("❌ Areas configuration missing 'areas' key")
-                return False
-            
-            areas = config['areas']
-            if not isinstance(areas, dict):
-                print("❌ Areas must be a dictionary")
-                return False
-            
-            # Validate each area
-            for area_name, area_config in areas.items():
-                if not self._validate_single_area(area_name, area_config):
-                    return False
-            
-            return True
-            
+            return self._validate_and_index_areas(config) is not None
         except Exception as e:
-            print(f"❌ Areas validation error: {e}")
+            log.warning("❌ Areas validation error: %s", e)
             return False
     
     def validate_sequences_config(self, config: Dict[str, Any]) -> bool:
@@ -282,69 +746,52 @@ class ConfigLoader:
             True if configuration is valid
         """
         try:
-            # Check required top-level keys
-            if 'sequences' not in config:
-                print("❌ Sequences configuration missing 'sequences' key")
-                return False
-            
-            sequences = config['sequences']
-            if not isinstance(sequences, dict):
-                print("❌ Sequences must be a dictionary")
-                return False
-            
-            # Validate each sequence
-            for seq_name, seq_config in sequences.items():
-                if not self._validate_single_sequence(seq_name, seq_config):
-                    return False
-            
-            return True
-            
+            return self._validate_and_index_sequences(config) is not None
         except Exception as e:
-            print(f"❌ Sequences validation error: {e}")
+            log.warning("❌ Sequences validation error: %s", e)
             return False
     
-    def _validate_single_area(self, area_name: str, area_config: Dict[str, Any]) -> bool:
-        """Validate a single area configuration"""
-        required_fields = ['name', 'coordinates', 'description']
-        
+    def _validate_single_area(self, area_name: str, area_config: Dict[str, Any], check_coordinates: bool = True) -> bool:
+        """Validate a single area configuration (coordinates are usually checked in batch)"""
         # Check required fields
-        for field in required_fields:
-            if field not in area_config:
-                print(f"❌ Area '{area_name}' missing required field: {field}")
-                return False
+        field = _missing_area_field(area_config)
+        if field is not None:
+            log.warning("❌ Area '%s' missing required field: %s", area_name, field)
+            return False
+        
+        if not check_coordinates:
+            return True
         
         # Validate coordinates format
         coordinates = area_config['coordinates']
-        if not isinstance(coordinates, list) or len(coordinates) != 4:
-            print(f"❌ Area '{area_name}' coordinates must be a list of 4 integers")
+        if not isinstance(coordinates, (list, tuple)) or len(coordinates) != 4:
+            log.warning("❌ Area '%s' coordinates must be a list of 4 integers", area_name)
             return False
         
         if not all(isinstance(coord, int) for coord in coordinates):
-            print(f"❌ Area '{area_name}' coordinates must be integers")
+            log.warning("❌ Area '%s' coordinates must be integers", area_name)
             return False
         
         # Validate coordinate values (x1, y1, x2, y2)
         x1, y1, x2, y2 = coordinates
         if x1 >= x2 or y1 >= y2:
-            print(f"❌ Area '{area_name}' has invalid coordinate bounds")
+            log.warning("❌ Area '%s' has invalid coordinate bounds", area_name)
             return False
         
         return True
     
     def _validate_single_sequence(self, seq_name: str, seq_config: Dict[str, Any]) -> bool:
         """Validate a single sequence configuration"""
-        required_fields = ['name', 'description', 'actions']
-        
         # Check required fields
-        for field in required_fields:
-            if field not in seq_config:
-                print(f"❌ Sequence '{seq_name}' missing required field: {field}")
-                return False
+        field = _missing_sequence_field(seq_config)
+        if field is not None:
+            log.warning("❌ Sequence '%s' missing required field: %s", seq_name, field)
+            return False
         
         # Validate actions
         actions = seq_config['actions']
         if not isinstance(actions, list):
-            print(f"❌ Sequence '{seq_name}' actions must be a list")
+            log.warning("❌ Sequence '%s' actions must be a list", seq_name)
             return False
         
         # Validate each action
@@ -356,32 +803,21 @@ class ConfigLoader:
     
     def _validate_single_action(self, seq_name: str, action_num: int, action: Dict[str, Any]) -> bool:
         """Validate a single action within a sequence"""
-        required_fields = ['type']
-        
         # Check required fields
-        for field in required_fields:
-            if field not in action:
-                print(f"❌ Sequence '{seq_name}' action {action_num} missing required field: {field}")
-                return False
+        field = _missing_action_field(action)
+        if field is not None:
+            log.warning("❌ Sequence '%s' action %s missing required field: %s", seq_name, action_num, field)
+            return False
         
         action_type = action['type']
-        valid_types = ['click_area', 'type_text', 'type_dynamic_text', 'select_all', 'copy_graphic', 'paste_graphic', 'press_key', 'wait']
-        
-        if action_type not in valid_types:
-            print(f"❌ Sequence '{seq_name}' action {action_num} has invalid type: {action_type}")
+        if action_type not in _VALID_ACTION_TYPES:
+            log.warning("❌ Sequence '%s' action %s has invalid type: %s", seq_name, action_num, action_type)
             return False
         
         # Type-specific validation
-        if action_type == 'click_area' and 'area' not in action:
-            print(f"❌ click_area action in '{seq_name}' missing 'area' field")
-            return False
-        
-        if action_type == 'type_text' and 'text' not in action:
-            print(f"❌ type_text action in '{seq_name}' missing 'text' field")
-            return False
-        
-        if action_type == 'press_key' and 'key' not in action:
-            print(f"❌ press_key action in '{seq_name}' missing 'key' field")
+        field = _ACTION_TYPE_REQUIRED_FIELDS.get(action_type)
+        if field is not None and field not in action:
+            log.warning("❌ %s action in '%s' missing '%s' field", action_type, seq_name, field)
             return False
         
         return True
@@ -417,7 +853,21 @@ class ConfigLoader:
         self.areas_cache = None
         self.sequences_cache = None
         self.settings_cache = None
-        print("🗑️ Configuration cache cleared")
+        self._areas_by_name = None
+        self._areas_by_category = None
+        self._sequences_by_name = None
+        self._sequences_by_category = None
+        self._action_plans = None
+        self.area_coords = None
+        self.area_names = None
+        _prepared_cache.clear()
+        _validated_keys.clear()
+        for cache_file in self.config_dir.glob(".*.msgpack"):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+        log.debug("🗑️ Configuration cache cleared")
     
     def export_configuration_summary(self) -> str:
         """
@@ -430,25 +880,25 @@ class ConfigLoader:
             areas_config = self.load_areas()
             sequences_config = self.load_sequences()
             
-            summary = []
-            summary.append("📋 BOOKBOLT CONFIGURATION SUMMARY")
-            summary.append("=" * 50)
+            areas = areas_config.get('areas', {})
+            sequences = sequences_config.get('sequences', {})
+            
+            summary = ["📋 BOOKBOLT CONFIGURATION SUMMARY", "=" * 50]
             
             # Areas summary
-            areas = areas_config.get('areas', {})
             summary.append(f"📍 CLICK AREAS ({len(areas)} total):")
-            for name, area in areas.items():
-                coords = area['coordinates']
-                category = area.get('category', 'unknown')
-                summary.append(f"   • {area['name']}: ({coords[0]}, {coords[1]}) → ({coords[2]}, {coords[3]}) [{category}]")
+            summary.extend(
+                f"   • {area['name']}: ({x1}, {y1}) → ({x2}, {y2}) [{area.get('category', 'unknown')}]"
+                for area in areas.values()
+                for x1, y1, x2, y2 in (area['coordinates'],)
+            )
             
             # Sequences summary
-            sequences = sequences_config.get('sequences', {})
             summary.append(f"\n🎬 ACTION SEQUENCES ({len(sequences)} total):")
-            for name, seq in sequences.items():
-                actions_count = len(seq.get('actions', []))
-                category = seq.get('category', 'unknown')
-                summary.append(f"   • {seq['name']}: {actions_count} actions [{category}]")
+            summary.extend(
+                f"   • {seq['name']}: {len(seq.get('actions', []))} actions [{seq.get('category', 'unknown')}]"
+                for seq in sequences.values()
+            )
             
             summary.append("\n" + "=" * 50)
             return "\n".join(summary)
@@ -459,28 +909,24 @@ class ConfigLoader:
 # Convenience functions for quick access
 def load_bookbolt_areas(config_dir: str = "config") -> Dict[str, Any]:
     """Quick function to load areas configuration"""
-    loader = ConfigLoader(config_dir)
-    return loader.load_areas()['areas']
+    return ConfigLoader.get(config_dir).load_areas()['areas']
 
 def load_bookbolt_sequences(config_dir: str = "config") -> Dict[str, Any]:
     """Quick function to load sequences configuration"""
-    loader = ConfigLoader(config_dir)
-    return loader.load_sequences()['sequences']
+    return ConfigLoader.get(config_dir).load_sequences()['sequences']
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     print("🧪 Testing Configuration Loader...")
     
     try:
         # Create loader
         loader = ConfigLoader("config")
         
-        # Test loading areas
-        areas_config = loader.load_areas()
+        # Test loading all configurations at once
+        areas_config, sequences_config, settings_config = loader.preload_all()
         print(f"✅ Areas loaded: {len(areas_config.get('areas', {}))}")
-        
-        # Test loading sequences
-        sequences_config = loader.load_sequences()
         print(f"✅ Sequences loaded: {len(sequences_config.get('sequences', {}))}")
         
         # Test utility functions
@@ -8,6 +8,7 @@ import math
 from typing import Tuple, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
 
 try:
     import pyautogui
@@ -16,13 +17,59 @@ except ImportError:
     PYAUTOGUI_AVAILABLE = False
     print("⚠️  pyautogui not available. Some screen detection features will be limited.")
 
+# Optional JIT compilation of the numeric kernels below
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in decorator: kernels run as plain NumPy code"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Shared generator for vectorized sampling
+_rng = np.random.default_rng()
+
+# Candidates drawn per rejection-sampling batch (acceptance is ~78.5% per candidate)
+_CIRCLE_SAMPLE_BATCH = 64
+
+@njit(cache=True)
+def _sample_in_circle_kernel(cx, cy, r):
+    """Scalar rejection sampling of an integer point in a circle (only used when JIT-compiled)"""
+    r2 = r * r
+    while True:
+        dx = np.random.randint(-r, r + 1)
+        dy = np.random.randint(-r, r + 1)
+        if dx * dx + dy * dy <= r2:
+            return cx + dx, cy + dy
+
+@njit(cache=True)
+def _bezier_path_kernel(x0, y0, x1, y1, x2, y2, steps):
+    """Quadratic Bezier P(t) = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂, truncated to integer x and y arrays"""
+    t = np.linspace(0.0, 1.0, steps)
+    omt = 1.0 - t
+    a = omt * omt
+    b = 2.0 * omt * t
+    c = t * t
+    xs = a * x0 + b * x1 + c * x2
+    ys = a * y0 + b * y1 + c * y2
+    return xs.astype(np.int64), ys.astype(np.int64)
+
+@njit(cache=True)
+def _clamp_array(arr, lo, hi):
+    """Clamp array values into [lo, hi]"""
+    return np.minimum(np.maximum(arr, lo), hi)
+
 class AreaShape(Enum):
     """Enumeration for different area shapes"""
     RECTANGLE = "rectangle"
     CIRCLE = "circle"
     ELLIPSE = "ellipse"
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """Represents a 2D point with x and y coordinates"""
     x: int
@@ -35,7 +82,7 @@ class Point:
     
     def distance_to(self, other: 'Point') -> float:
         """Calculate distance to another point"""
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        return math.hypot(self.x - other.x, self.y - other.y)
     
     def offset(self, x_offset: int, y_offset: int) -> 'Point':
         """Create new point with offset applied"""
@@ -48,7 +95,7 @@ class Point:
     def __str__(self) -> str:
         return f"Point({self.x}, {self.y})"
 
-@dataclass
+@dataclass(slots=True)
 class Rectangle:
     """Represents a rectangular area"""
     x1: int  # Top-left X
@@ -61,6 +108,13 @@ class Rectangle:
         self.x1, self.x2 = int(min(self.x1, self.x2)), int(max(self.x1, self.x2))
         self.y1, self.y2 = int(min(self.y1, self.y2)), int(max(self.y1, self.y2))
     
+    @classmethod
+    def _unchecked(cls, x1: int, y1: int, x2: int, y2: int) -> 'Rectangle':
+        """Build a rectangle from already ordered integer corners, skipping normalization"""
+        rect = object.__new__(cls)
+        rect.x1, rect.y1, rect.x2, rect.y2 = x1, y1, x2, y2
+        return rect
+    
     @property
     def width(self) -> int:
         """Get rectangle width"""
@@ -87,11 +141,17 @@ class Rectangle:
     
     def intersects(self, other: 'Rectangle') -> bool:
         """Check if this rectangle intersects with another"""
-        return not (self.x2 < other.x1 or other.x2 < self.x1 or 
-                   self.y2 < other.y1 or other.y2 < self.y1)
+        return rects_intersect(self.x1, self.y1, self.x2, self.y2,
+                               other.x1, other.y1, other.x2, other.y2)
     
     def expand(self, margin: int) -> 'Rectangle':
         """Create expanded rectangle with margin"""
+        if margin >= 0:
+            # Growing keeps the corners ordered
+            return Rectangle._unchecked(
+                self.x1 - margin, self.y1 - margin,
+                self.x2 + margin, self.y2 + margin
+            )
         return Rectangle(
             self.x1 - margin, self.y1 - margin,
             self.x2 + margin, self.y2 + margin
@@ -104,7 +164,7 @@ class Rectangle:
     def __str__(self) -> str:
         return f"Rectangle({self.x1}, {self.y1}, {self.x2}, {self.y2}) [{self.width}x{self.height}]"
 
-@dataclass
+@dataclass(slots=True)
 class Circle:
     """Represents a circular area"""
     center_x: int
@@ -128,8 +188,10 @@ class Circle:
     
     def contains(self, point: Point) -> bool:
         """Check if point is inside circle"""
-        distance = self.center.distance_to(point)
-        return distance <= self.radius
+        # Compare squared distances, no sqrt needed
+        dx = point.x - self.center_x
+        dy = point.y - self.center_y
+        return dx * dx + dy * dy <= self.radius * self.radius
     
     def bounding_box(self) -> Rectangle:
         """Get bounding rectangle of circle"""
@@ -262,18 +324,24 @@ class CoordinateHelper:
         Get random point within circle using uniform distribution.
         Uses rejection sampling for true uniform distribution.
         """
-        max_attempts = 100
-        for _ in range(max_attempts):
-            # Generate random point in bounding box
-            bbox = circle.bounding_box()
-            point = self.get_random_point_in_rectangle(bbox)
-            
-            # Check if point is inside circle
-            if circle.contains(point):
-                return point
-        
-        # Fallback: return center if sampling fails
-        return circle.center
+        cx, cy, r = circle.center_x, circle.center_y, circle.radius
+        
+        if NUMBA_AVAILABLE:
+            x, y = _sample_in_circle_kernel(cx, cy, r)
+            return Point(x, y)
+        
+        # Draw a batch of candidates in the bounding box and keep the first inside the circle
+        xs = _rng.integers(cx - r, cx + r, size=_CIRCLE_SAMPLE_BATCH, endpoint=True)
+        ys = _rng.integers(cy - r, cy + r, size=_CIRCLE_SAMPLE_BATCH, endpoint=True)
+        inside = (xs - cx) ** 2 + (ys - cy) ** 2 <= r * r
+        if inside.any():
+            idx = int(inside.argmax())
+            return Point(int(xs[idx]), int(ys[idx]))
+        
+        # Fallback: polar sampling always lands inside
+        radius = r * math.sqrt(random.random())
+        angle = random.uniform(0, 2 * math.pi)
+        return Point(cx + int(radius * math.cos(angle)), cy + int(radius * math.sin(angle)))
     
     def get_random_point_on_circle_edge(self, circle: Circle, 
                                        thickness: int = 1) -> Point:
@@ -366,7 +434,7 @@ class CoordinateHelper:
     
     def calculate_distance(self, x1: int, y1: int, x2: int, y2: int) -> float:
         """Calculate Euclidean distance between two points"""
-        return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        return math.hypot(x2 - x1, y2 - y1)
     
     def calculate_point_distance(self, point1: Point, point2: Point) -> float:
         """Calculate distance between two points"""
@@ -416,8 +484,6 @@ class CoordinateHelper:
         if steps <= 2:
             return [start, end]
         
-        path = []
-        
         # Calculate control points for Bezier curve
         distance = start.distance_to(end)
         
@@ -435,23 +501,16 @@ class CoordinateHelper:
         
         control_point = Point(mid_x + control_offset_x, mid_y + control_offset_y)
         
-        # Generate points along quadratic Bezier curve
-        for i in range(steps):
-            t = i / (steps - 1)  # Parameter from 0 to 1
-            
-            # Quadratic Bezier: P(t) = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
-            x = ((1 - t) ** 2 * start.x + 
-                 2 * (1 - t) * t * control_point.x + 
-                 t ** 2 * end.x)
-            y = ((1 - t) ** 2 * start.y + 
-                 2 * (1 - t) * t * control_point.y + 
-                 t ** 2 * end.y)
-            
-            # Clamp coordinates to screen bounds
-            point = self.clamp_coordinates(int(x), int(y))
-            path.append(point)
+        # Generate all points along the quadratic Bezier curve at once
+        xs, ys = _bezier_path_kernel(
+            start.x, start.y, control_point.x, control_point.y, end.x, end.y, steps
+        )
         
-        return path
+        # Clamp coordinates to screen bounds
+        xs = _clamp_array(xs, 0, self.screen_width).tolist()
+        ys = _clamp_array(ys, 0, self.screen_height).tolist()
+        
+        return [Point(x, y) for x, y in zip(xs, ys)]
     
     def generate_natural_path(self, start: Point, end: Point, 
                              human_like: bool = True) -> List[Point]:
@@ -483,18 +542,17 @@ class CoordinateHelper:
         path = self.generate_smooth_path(start, end, steps, curve_intensity)
         
         if human_like:
-            # Add small random variations to simulate human imperfections
-            varied_path = []
-            for point in path:
-                # Small random offset (1-2 pixels)
-                offset_point = self.offset_coordinates(
-                    point.x, point.y, 
-                    max_offset=2, 
-                    distribution="gaussian"
-                )
-                varied_path.append(offset_point)
+            # Add small random variations to simulate human imperfections:
+            # gaussian offsets (1-2 pixels) for the whole path in one draw
+            max_offset = 2
+            coords = np.array([(point.x, point.y) for point in path], dtype=np.int64)
+            noise = _rng.normal(0, max_offset / 3, size=coords.shape).astype(np.int64)
+            coords += np.clip(noise, -max_offset, max_offset)
             
-            path = varied_path
+            # Ensure coordinates stay within screen bounds
+            xs = _clamp_array(coords[:, 0], 0, self.screen_width).tolist()
+            ys = _clamp_array(coords[:, 1], 0, self.screen_height).tolist()
+            path = [Point(x, y) for x, y in zip(xs, ys)]
         
         return path
     
@@ -515,7 +573,7 @@ class CoordinateHelper:
         Returns:
             Rectangle: Safe clicking area
         """
-        safe_rect = Rectangle(
+        safe_rect = Rectangle._unchecked(
             rect.x1 + safety_margin,
             rect.y1 + safety_margin,
             rect.x2 - safety_margin,
@@ -564,6 +622,11 @@ class CoordinateHelper:
         return points
 
 # Convenience functions for quick operations
+def rects_intersect(ax1: int, ay1: int, ax2: int, ay2: int,
+                    bx1: int, by1: int, bx2: int, by2: int) -> bool:
+    """Check if two ordered (x1, y1, x2, y2) boxes intersect, without building Rectangles"""
+    return ax1 <= bx2 and bx1 <= ax2 and ay1 <= by2 and by1 <= ay2
+
 def create_rectangle_from_ranges(x_range: Tuple[int, int], 
                                 y_range: Tuple[int, int]) -> Rectangle:
     """Create Rectangle from coordinate ranges"""
@@ -220,7 +220,29 @@ class AutomationLogger:
         
         return self.root_logger
     
-    def log_automation_action(self, action: str, details: str = "", success: bool = True):
+    def _emit(self, logger: logging.Logger, level: int, message: str, created: Optional[float] = None):
+        """
+        Log a message, optionally stamped with an earlier time.
+        
+        Args:
+            logger: Target logger
+            level: Logging level
+            message: Formatted message
+            created: time.time() when the event happened (for records logged later)
+        """
+        if created is None:
+            logger.log(level, message, stacklevel=2)
+            return
+        
+        if not logger.isEnabledFor(level):
+            return
+        record = logger.makeRecord(logger.name, level, __file__, 0, message, None, None, func="deferred")
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        logger.handle(record)
+    
+    def log_automation_action(self, action: str, details: str = "", success: bool = True,
+                              created: Optional[float] = None):
         """
         Log automation actions with consistent formatting.
         
@@ -228,6 +250,7 @@ class AutomationLogger:
             action: Action performed (click, type, wait, etc.)
             details: Additional details about the action
             success: Whether the action was successful
+            created: Optional time.time() timestamp of the action
         """
         status_emoji = "✅" if success else "❌"
         status_text = "SUCCESS" if success else "FAILED"
@@ -238,10 +261,7 @@ class AutomationLogger:
         message += f" | Status: {status_text}"
         
         logger = self.get_logger("actions")
-        if success:
-            logger.info(message)
-        else:
-            logger.error(message)
+        self._emit(logger, logging.INFO if success else logging.ERROR, message, created)
     
     def log_performance_metric(self, operation: str, duration: float, additional_info: str = ""):
         """
@@ -277,7 +297,8 @@ class AutomationLogger:
         logger = self.get_logger("browser")
         logger.info(message)
     
-    def log_mouse_event(self, event: str, coordinates: tuple = None, details: str = ""):
+    def log_mouse_event(self, event: str, coordinates: tuple = None, details: str = "",
+                        created: Optional[float] = None):
         """
         Log mouse-specific events.
         
@@ -285,6 +306,7 @@ class AutomationLogger:
             event: Mouse event (click, move, drag, etc.)
             coordinates: Mouse coordinates (x, y)
             details: Additional details
+            created: Optional time.time() timestamp of the event
         """
         message = f"🖱️  MOUSE | {event.upper()}"
         if coordinates:
@@ -293,9 +315,10 @@ class AutomationLogger:
             message += f" | {details}"
         
         logger = self.get_logger("mouse")
-        logger.info(message)
+        self._emit(logger, logging.INFO, message, created)
     
-    def log_detection_event(self, event: str, details: str = "", risk_level: str = "INFO"):
+    def log_detection_event(self, event: str, details: str = "", risk_level: str = "INFO",
+                            created: Optional[float] = None):
         """
         Log anti-detection related events.
         
@@ -303,6 +326,7 @@ class AutomationLogger:
             event: Detection event
             details: Event details
             risk_level: Risk level (INFO, WARNING, ERROR)
+            created: Optional time.time() timestamp of the event
         """
         emoji_map = {
             "INFO": "🔒",
@@ -316,8 +340,8 @@ class AutomationLogger:
             message += f" | {details}"
         
         logger = self.get_logger("detection")
-        log_method = getattr(logger, risk_level.lower())
-        log_method(message)
+        level = logging.getLevelName(risk_level.upper())
+        self._emit(logger, level if isinstance(level, int) else logging.INFO, message, created)
     
     def create_session_log(self) -> str:
         """
@@ -411,9 +435,9 @@ def get_logger(name: Optional[str] = None):
     return automation_logger.get_logger(name)
 
 # Convenience functions for specific log types
-def log_action(action: str, details: str = "", success: bool = True):
+def log_action(action: str, details: str = "", success: bool = True, created: Optional[float] = None):
     """Log automation action"""
-    automation_logger.log_automation_action(action, details, success)
+    automation_logger.log_automation_action(action, details, success, created)
 
 def log_performance(operation: str, duration: float, additional_info: str = ""):
     """Log performance metric"""
@@ -423,13 +447,13 @@ def log_browser(event: str, url: str = "", details: str = ""):
     """Log browser event"""
     automation_logger.log_browser_event(event, url, details)
 
-def log_mouse(event: str, coordinates: tuple = None, details: str = ""):
+def log_mouse(event: str, coordinates: tuple = None, details: str = "", created: Optional[float] = None):
     """Log mouse event"""
-    automation_logger.log_mouse_event(event, coordinates, details)
+    automation_logger.log_mouse_event(event, coordinates, details, created)
 
-def log_detection(event: str, details: str = "", risk_level: str = "INFO"):
+def log_detection(event: str, details: str = "", risk_level: str = "INFO", created: Optional[float] = None):
     """Log anti-detection event"""
-    automation_logger.log_detection_event(event, details, risk_level)
+    automation_logger.log_detection_event(event, details, risk_level, created)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -10,6 +10,9 @@ from typing import Tuple, List, Optional, Dict, Any
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
 
 class ActivityLevel(Enum):
     """Different levels of user activity"""
@@ -39,12 +42,38 @@ class BehaviorProfile:
     fatigue_factor: float = 0.0          # How tired the user gets over time (0.0-1.0)
     consistency: float = 0.7             # How consistent the behavior is (0.0-1.0)
 
+@lru_cache(maxsize=256)
+def _typing_char_multiplier(char: str) -> float:
+    """Upper-bound multiplier of the keystroke delay for a character (cached per character)"""
+    if char in ' \n\t':  # Space or newlines
+        return 1.5  # Slight pause at word boundaries
+    if char in '.,!?;:':  # Punctuation
+        return 1.3  # Pause at punctuation
+    if char.isupper():  # Capital letters
+        return 1.1  # Slight pause for shift key
+    if char.isdigit():  # Numbers
+        return 1.2  # Numbers often require more thought
+    return 1.0
+
 class RandomHelper:
     """
     Advanced random behavior generator for human-like automation.
     Simulates natural human patterns, timing variations, and realistic interactions.
     """
     
+    # Character codes that lengthen the keystroke delay
+    _WHITESPACE_CODES = np.array([ord(c) for c in ' \n\t'], dtype=np.uint32)
+    _PUNCTUATION_CODES = np.array([ord(c) for c in '.,!?;:'], dtype=np.uint32)
+    
+    # Timing multiplier ranges per activity level
+    ACTIVITY_MULTIPLIER_RANGES = {
+        ActivityLevel.TIRED: (1.3, 1.8),       # 30-80% slower
+        ActivityLevel.NORMAL: (0.9, 1.1),      # ±10% variation
+        ActivityLevel.ENERGETIC: (0.6, 0.9),   # 10-40% faster
+        ActivityLevel.FOCUSED: (0.8, 1.0),     # Slightly faster
+        ActivityLevel.DISTRACTED: (1.1, 1.6)   # 10-60% slower
+    }
+    
     def __init__(self, behavior_profile: Optional[BehaviorProfile] = None):
         self.behavior_profile = behavior_profile or BehaviorProfile()
         self.session_start = datetime.now()
@@ -134,14 +163,7 @@ class RandomHelper:
         
         # Character-specific adjustments
         if char:
-            if char in ' \n\t':  # Space or newlines
-                max_delay *= 1.5  # Slight pause at word boundaries
-            elif char in '.,!?;:':  # Punctuation
-                max_delay *= 1.3  # Pause at punctuation
-            elif char.isupper():  # Capital letters
-                max_delay *= 1.1  # Slight pause for shift key
-            elif char.isdigit():  # Numbers
-                max_delay *= 1.2  # Numbers often require more thought
+            max_delay *= _typing_char_multiplier(char)
         
         base_delay = random.uniform(min_delay, max_delay)
         
@@ -286,6 +308,18 @@ class RandomHelper:
         Returns:
             bool: True if hesitation should occur
         """
+        return random.random() < self.hesitation_prob(complexity)
+    
+    def hesitation_prob(self, complexity: str = "normal") -> float:
+        """
+        Get current probability of hesitating before an action.
+        
+        Args:
+            complexity: Action complexity (simple, normal, complex)
+            
+        Returns:
+            float: Hesitation probability (capped at 40%)
+        """
         base_probability = self.behavior_profile.hesitation_tendency
         
         complexity_multipliers = {
@@ -308,7 +342,7 @@ class RandomHelper:
         final_probability = (base_probability * complexity_factor * 
                            fatigue_factor * attention_factor)
         
-        return random.random() < min(0.4, final_probability)  # Cap at 40%
+        return min(0.4, final_probability)  # Cap at 40%
     
     def should_take_break(self) -> bool:
         """
@@ -334,13 +368,82 @@ class RandomHelper:
     
     def should_double_check(self) -> bool:
         """Decide if user should double-check their action"""
+        return random.random() < self.double_check_prob()
+    
+    def double_check_prob(self) -> float:
+        """Get probability of double-checking an action"""
         # Focused users double-check more often
         if self.behavior_profile.activity_level == ActivityLevel.FOCUSED:
-            return random.random() < 0.3
+            return 0.3
         elif self.behavior_profile.activity_level == ActivityLevel.DISTRACTED:
-            return random.random() < 0.05
+            return 0.05
         else:
-            return random.random() < 0.15
+            return 0.15
+    
+    # Batched sampling
+    
+    def get_click_delays(self, min_delay: float, max_delay: float, size: int) -> np.ndarray:
+        """
+        Draw many contextual click delays at once (vectorized get_click_delay).
+        
+        Args:
+            min_delay: Minimum delay in seconds
+            max_delay: Maximum delay in seconds
+            size: Number of delays to draw
+            
+        Returns:
+            np.ndarray: Delays in seconds
+        """
+        base_delay = np.random.uniform(min_delay, max_delay, size)
+        
+        # Activity level and fatigue effects
+        low, high = self.ACTIVITY_MULTIPLIER_RANGES.get(
+            self.behavior_profile.activity_level, (1.0, 1.0)
+        )
+        activity_multiplier = np.random.uniform(low, high, size)
+        fatigue_multiplier = 1 + (self.get_current_fatigue() * 0.5)
+        
+        # Inconsistent behavior adds more variation
+        inconsistent = np.random.random(size) > self.behavior_profile.consistency
+        base_delay = np.where(inconsistent, base_delay * np.random.uniform(0.5, 1.5, size), base_delay)
+        
+        final_delay = base_delay * activity_multiplier * fatigue_multiplier
+        return np.clip(final_delay, min_delay, max_delay * 2)
+    
+    def get_typing_delays(self, text: str, base_min: float = 0.05,
+                          base_max: float = 0.15) -> np.ndarray:
+        """
+        Draw keystroke delays for every character of text at once (vectorized get_typing_delay).
+        Character classes are detected for ASCII text.
+        
+        Args:
+            text: Text that will be typed
+            base_min: Base minimum delay
+            base_max: Base maximum delay
+            
+        Returns:
+            np.ndarray: Delay in seconds per character
+        """
+        min_delay, max_delay = self._get_typing_style_delays(base_min, base_max)
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        
+        # Character-specific adjustments to the upper bound
+        max_multiplier = np.ones(len(codes))
+        max_multiplier[(codes >= 65) & (codes <= 90)] = 1.1            # Capital letters
+        max_multiplier[(codes >= 48) & (codes <= 57)] = 1.2            # Numbers
+        max_multiplier[np.isin(codes, self._PUNCTUATION_CODES)] = 1.3   # Punctuation
+        max_multiplier[np.isin(codes, self._WHITESPACE_CODES)] = 1.5    # Word boundaries
+        
+        base_delay = np.random.uniform(min_delay, max_delay * max_multiplier)
+        
+        # Apply activity and fatigue effects
+        low, high = self.ACTIVITY_MULTIPLIER_RANGES.get(
+            self.behavior_profile.activity_level, (1.0, 1.0)
+        )
+        activity_multiplier = np.random.uniform(low, high, len(codes))
+        fatigue_multiplier = 1 + (self.get_current_fatigue() * 0.7)
+        
+        return base_delay * activity_multiplier * fatigue_multiplier
     
     # Movement and interaction randomization
     
@@ -424,15 +527,10 @@ class RandomHelper:
     
     def _get_activity_multiplier(self) -> float:
         """Get timing multiplier based on activity level"""
-        multipliers = {
-            ActivityLevel.TIRED: random.uniform(1.3, 1.8),      # 30-80% slower
-            ActivityLevel.NORMAL: random.uniform(0.9, 1.1),     # ±10% variation
-            ActivityLevel.ENERGETIC: random.uniform(0.6, 0.9),  # 10-40% faster
-            ActivityLevel.FOCUSED: random.uniform(0.8, 1.0),    # Slightly faster
-            ActivityLevel.DISTRACTED: random.uniform(1.1, 1.6)  # 10-60% slower
-        }
-        
-        return multipliers.get(self.behavior_profile.activity_level, 1.0)
+        multiplier_range = self.ACTIVITY_MULTIPLIER_RANGES.get(self.behavior_profile.activity_level)
+        if multiplier_range is None:
+            return 1.0
+        return random.uniform(*multiplier_range)
     
     def _get_typing_style_delays(self, base_min: float, base_max: float) -> Tuple[float, float]:
         """Get typing delays based on typing style"""
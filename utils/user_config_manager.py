@@ -4,6 +4,7 @@ Handles user input, template selection, and configuration management
 """
 
 import json
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -21,8 +22,32 @@ class UserConfigManager:
         self.selected_template = None
         self.start_number = None
         self.total_notebooks = None
+        self.fast_mode = False  # Skip the eased mouse moves and pre-click pauses
+        self._notebook_local = threading.local()
         self.current_notebook_number = None
         
+        # (template id, notebook number) -> text of the last generated dynamic text
+        self._dynamic_text_cache = (None, None)
+    
+    @property
+    def current_notebook_number(self) -> Optional[int]:
+        """Notebook number bound to the calling worker thread, else the shared one"""
+        return getattr(self._notebook_local, 'number', self._current_notebook_number)
+    
+    @current_notebook_number.setter
+    def current_notebook_number(self, value: Optional[int]):
+        if hasattr(self._notebook_local, 'number'):
+            self._notebook_local.number = value
+        else:
+            self._current_notebook_number = value
+    
+    def bind_thread_notebook_number(self, number: Optional[int]):
+        """Give the calling thread its own notebook number (None to unbind)"""
+        if number is None:
+            self._notebook_local.__dict__.pop('number', None)
+        else:
+            self._notebook_local.number = number
+        
     def _load_templates(self) -> Dict[str, Any]:
         """Load templates from JSON file"""
         try:
@@ -167,11 +192,19 @@ class UserConfigManager:
         Returns:
             str: Generated text with template and current number
         """
-        if not self.selected_template or self.current_notebook_number is None:
+        number = self.current_notebook_number
+        if not self.selected_template or number is None:
             return "Default Text"
         
+        # Same notebook as the last call (e.g. batch preview, then typing): reuse the text
+        key = (id(self.selected_template), number)
+        cached_key, cached_text = self._dynamic_text_cache
+        if cached_key == key:
+            return cached_text
+        
         # Format: "Prefix" + number + "Suffix"
-        dynamic_text = f"{self.selected_template['prefix']} {self.current_notebook_number} {self.selected_template['suffix']}"
+        dynamic_text = f"{self.selected_template['prefix']} {number} {self.selected_template['suffix']}"
+        self._dynamic_text_cache = (key, dynamic_text)
         return dynamic_text
     
     def get_configuration_summary(self) -> Dict[str, Any]: